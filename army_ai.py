@@ -3,8 +3,46 @@ Strategic and Tactical AI for army command
 General AI: Macro-level strategy with reserves
 Officer AI: Tactical squad management with threat evaluation
 """
+import logging
 import math
 import random
+from math import sqrt
+import numpy as np
+from game.blackboard import TEAM_TAGS, Order, Threat
+
+# AI trace output is debug-level; enable with logging.getLogger("game.army_ai").setLevel(logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+# Capture priority penalty, indexed by Threat
+CAPTURE_THREAT_PENALTY = (0.0, 0.3, 0.6, 1.0)
+
+# Capture progress bonus 1.0 + progress^2 * 3.0, indexed by progress percent (0-100)
+CAPTURE_PROGRESS_BONUS = tuple(1.0 + (pct / 100.0) ** 2 * 3.0 for pct in range(101))
+
+# Combat priority, indexed by Threat (high threat is further scaled by morale)
+COMBAT_THREAT_PRIORITY = (0.3, 0.8, 1.5, 0.0)
+
+# Golden-ratio step used to spread periodic decision timers over their cooldown
+DECISION_PHASE_STEP = 0.6180339887
+
+# General heading is re-normalized at least this often while the destination is unchanged
+HEADING_REFRESH_FRAMES = 30
+
+# Unit-circle offsets for scout patrol rings, keyed by scout count
+_RING_CACHE = {}
+
+
+def get_ring_offsets(count):
+    """Get count evenly spaced (cos, sin) unit-circle offsets, computed once per count"""
+    ring = _RING_CACHE.get(count)
+    if ring is None:
+        ring = []
+        for i in range(count):
+            angle = (i / count) * 2 * math.pi
+            ring.append((math.cos(angle), math.sin(angle)))
+        _RING_CACHE[count] = ring
+    return ring
 
 
 class GeneralAI:
@@ -17,20 +55,25 @@ class GeneralAI:
     """
     def __init__(self, team_id, blackboard, formation_manager):
         self.team_id = team_id
+        self.enemy_team_id = 1 - team_id
         self.blackboard = blackboard
         self.formation_manager = formation_manager
+        self._team_tag = TEAM_TAGS[team_id]
 
         # Strategic state
-        self.current_strategy = "advance"  # "attack", "defend", "advance", "retreat"
+        self.current_strategy = Order.ADVANCE  # ATTACK, DEFEND, ADVANCE, EXPAND, DESPERATE_ATTACK
+        self._tick_goal = None  # Blackboard strategic goal, fetched once per tick
         self.decision_cooldown = 2.0  # Re-evaluate strategy every 2 seconds
         self.decision_timer = 0.0
 
         # Reserve management
         self.reserve_squads = []
         self.active_squads = []
+        self._last_goal = None  # (strategy, target name) the active squads were last ordered toward
 
         # Objective priorities (base_name -> importance_multiplier)
         self.objective_priorities = {}
+        self._priority_array = None  # Per-base priorities indexed by base.base_id
 
         # Game time tracking
         self.game_time = 0.0
@@ -40,27 +83,53 @@ class GeneralAI:
         self.target_position = None   # Where general should move to
         self.last_owned_bases = 0     # Track base loss
         self.repositioning_threshold = 400  # Move if center of mass shifts by this much
+        self.max_distance_from_army = 600   # Move if general is this far from army
+        # Either distance trigger fires past the smaller threshold (compared squared)
+        self._reposition_dist_sq = min(self.repositioning_threshold, self.max_distance_from_army) ** 2
+
+        # Officer center of mass memo: (sum_x, sum_y, count, game_time)
+        self._center_cache = (0.0, 0.0, 0, -1.0)
+
+        # Cached general velocity: reused while the destination key is unchanged
+        self._heading = (0.0, 0.0)
+        self._heading_key = None
+        self._heading_age = 0
 
     def set_objective_priority(self, base_name, multiplier):
         """Set strategic value of objective (1.0 = normal, >1.0 = high value)"""
         self.objective_priorities[base_name] = multiplier
+        self._priority_array = None
+
+    def _get_priority_array(self, objective_system):
+        """Get strategic values as an array indexed by base.base_id"""
+        bases = objective_system.bases
+        if self._priority_array is None or len(self._priority_array) != len(bases):
+            self._priority_array = np.array(
+                [self.objective_priorities.get(b.name, 1.0) for b in bases], dtype=np.float32
+            )
+        return self._priority_array
 
     def update(self, dt, entity_manager, general_entity, objective_system, game_time=0.0):
         """Update strategic decision making"""
         self.game_time = game_time
         self.decision_timer += dt
+        self._tick_goal = self.blackboard.get_strategic_goal(self.team_id)
 
         # Update general's current position
-        transform = general_entity.get_component("Transform")
+        transform = general_entity.transform
         if transform:
             self.current_position = (transform.x, transform.y)
 
+        # Team officers, filtered once per tick and shared by all helpers
+        officers = self._scan_team_officers(entity_manager)
+
         if self.decision_timer >= self.decision_cooldown:
             self.decision_timer = 0.0
-            self.make_strategic_decision(entity_manager, general_entity, objective_system)
+            generals = self._get_team_commanders(entity_manager, "general")
+            self.make_strategic_decision(entity_manager, general_entity, objective_system, officers, generals)
 
             # Check if general needs to reposition
-            self.check_repositioning_needed(entity_manager, general_entity, objective_system)
+            self.check_repositioning_needed(officers, general_entity, objective_system)
 
         # Check if reserves should be committed
         if self.should_commit_reserves():
@@ -71,143 +140,165 @@ class GeneralAI:
             self.move_general_to_position(transform, dt)
         else:
             # No active repositioning - gently drift toward strategic objective
-            self.drift_toward_objective(entity_manager, transform, dt)
+            self.drift_toward_objective(officers, transform, dt)
+
+    def _scan_team_officers(self, entity_manager):
+        """
+        Filter this team's active officers and sum their positions in one pass.
+        Primes the per-tick center of mass cache and returns the officer list.
+        """
+        officers = entity_manager.get_entities_with_tags("officer", self._team_tag)
+        sum_x = 0.0
+        sum_y = 0.0
+        count = 0
+
+        for officer in officers:
+            transform = officer.transform
+            if transform:
+                sum_x += transform.x
+                sum_y += transform.y
+                count += 1
+
+        self._center_cache = (sum_x, sum_y, count, self.game_time)
+        return officers
 
-    def make_strategic_decision(self, entity_manager, general_entity, objective_system):
+    def _get_team_commanders(self, entity_manager, rank_tag):
+        """Get active entities with rank_tag belonging to this general's team"""
+        return entity_manager.get_entities_with_tags(rank_tag, self._team_tag)
+
+    def make_strategic_decision(self, entity_manager, general_entity, objective_system, officers, generals):
         """
         Main strategic decision loop.
         Analyzes battlefield and issues orders to officers.
         """
+        priorities = self._get_priority_array(objective_system)
+
+        # Army center only needs to be computed once for all branches below
+        army_center = self._calculate_army_center(officers, generals)
+
         # Update team statistics
         self.blackboard.update_team_stats(self.team_id, entity_manager)
         team_stats = self.blackboard.get_team_stats(self.team_id)
-        enemy_stats = self.blackboard.get_team_stats(1 - self.team_id)
+        enemy_stats = self.blackboard.get_team_stats(self.enemy_team_id)
 
-        print(f"[GENERAL TEAM {self.team_id}] Units: {team_stats['total_units']}, Enemy: {enemy_stats['total_units']}")
+        logger.debug("[GENERAL TEAM %s] Units: %s, Enemy: %s",
+                     self.team_id, team_stats['total_units'], enemy_stats['total_units'])
 
         # Evaluate base ownership
-        player_bases = len(objective_system.get_player_bases() if self.team_id == 0
-                          else objective_system.get_enemy_bases())
-        enemy_bases = len(objective_system.get_enemy_bases() if self.team_id == 0
-                         else objective_system.get_player_bases())
+        player_bases = len(objective_system.get_team_bases(self.team_id))
+        enemy_bases = len(objective_system.get_enemy_bases_for(self.team_id))
         neutral_bases = len(objective_system.get_neutral_bases())
 
         # Strategic decision tree with weighted objectives
         if player_bases == 0 and enemy_bases > 0:
             # Desperate - we have no bases, attack nearest
-            self.current_strategy = "desperate_attack"
-            target = self.choose_target_objective(objective_system, strategy="nearest", entity_manager=entity_manager)
+            self.current_strategy = Order.DESPERATE_ATTACK
+            target = self.choose_target_objective(objective_system, strategy="nearest", army_center=army_center)
 
         elif enemy_bases > player_bases:
             # Losing map control - attack enemy base (prioritize high-value targets)
-            self.current_strategy = "attack"
-            target = self.choose_target_objective(objective_system, strategy="weighted_enemy", entity_manager=entity_manager)
+            self.current_strategy = Order.ATTACK
+            target = self.choose_target_objective(objective_system, strategy="weighted_enemy", army_center=army_center)
 
         elif neutral_bases > 0:
             # Expand - capture neutral bases
-            self.current_strategy = "expand"
-            target = self.choose_target_objective(objective_system, strategy="weighted_neutral", entity_manager=entity_manager)
+            self.current_strategy = Order.EXPAND
+            target = self.choose_target_objective(objective_system, strategy="weighted_neutral", army_center=army_center)
 
         elif team_stats["total_units"] < enemy_stats["total_units"] * 0.7:
             # Numerically inferior - defend our bases
-            self.current_strategy = "defend"
+            self.current_strategy = Order.DEFEND
             target = self.choose_defensive_position(objective_system)
 
         else:
             # Winning - advance and pressure
-            self.current_strategy = "advance"
-            target = self.choose_target_objective(objective_system, strategy="weighted_enemy", entity_manager=entity_manager)
+            self.current_strategy = Order.ADVANCE
+            target = self.choose_target_objective(objective_system, strategy="weighted_enemy", army_center=army_center)
 
         # Issue strategic goal to blackboard
         self.blackboard.set_strategic_goal(self.team_id, self.current_strategy, target)
+        self._tick_goal = self.blackboard.get_strategic_goal(self.team_id)
 
         # Debug output
         if target:
-            print(f"[GENERAL TEAM {self.team_id}] Strategy: {self.current_strategy}, Target: {target.name} at ({int(target.x)}, {int(target.y)})")
+            logger.debug("[GENERAL TEAM %s] Strategy: %s, Target: %s at (%d, %d)",
+                         self.team_id, self.current_strategy.name, target.name, target.x, target.y)
         else:
-            print(f"[GENERAL TEAM {self.team_id}] Strategy: {self.current_strategy}, No target")
+            logger.debug("[GENERAL TEAM %s] Strategy: %s, No target", self.team_id, self.current_strategy.name)
 
         # Assign squads to objectives
-        self.assign_squads_to_objectives(entity_manager)
+        self.assign_squads_to_objectives(officers, priorities)
 
-    def choose_target_objective(self, objective_system, strategy="nearest", entity_manager=None):
+    def choose_target_objective(self, objective_system, strategy="nearest", army_center=(None, None)):
         """
         Choose target base with strategic value weighting and distance factor.
         """
-        if strategy == "nearest":
-            # Simple: attack nearest enemy base
-            if self.team_id == 0:
-                bases = objective_system.get_enemy_bases()
-            else:
-                bases = objective_system.get_player_bases()
-
-        elif strategy == "weighted_enemy":
-            # Weighted: prioritize high-value enemy bases
-            if self.team_id == 0:
-                bases = objective_system.get_enemy_bases()
-            else:
-                bases = objective_system.get_player_bases()
+        if strategy == "nearest" or strategy == "weighted_enemy":
+            # Attack enemy base (nearest / prioritize high-value targets)
+            indices = np.flatnonzero(objective_system.bases_owner == self.enemy_team_id)
 
         elif strategy == "weighted_neutral":
             # Capture high-value neutral bases first
-            bases = objective_system.get_neutral_bases()
+            indices = np.flatnonzero(objective_system.bases_owner == -1)
 
         else:
-            bases = objective_system.bases
+            indices = np.arange(len(objective_system.bases))
 
-        if not bases:
+        if indices.size == 0:
             return None
 
         # Calculate army center of mass for distance calculations
-        army_center_x, army_center_y = self._calculate_army_center(entity_manager)
+        army_center_x, army_center_y = army_center
 
         # Score each base: strategic_value / (distance_factor)
         # This makes closer bases more attractive, especially for similar strategic values
-        def score_base(base):
-            strategic_value = self.objective_priorities.get(base.name, 1.0)
-
-            if army_center_x is not None:
-                dx = base.x - army_center_x
-                dy = base.y - army_center_y
-                distance = math.sqrt(dx*dx + dy*dy)
-                # Normalize distance: divide by 1000 to get a 0-3 range typically
-                # Add 0.5 to prevent division by zero and avoid over-prioritizing super close bases
-                distance_factor = (distance / 1000.0) + 0.5
-
-                # Score = strategic value / distance factor
-                # Higher strategic value = higher score
-                # Lower distance = higher score
-                return strategic_value / distance_factor
-            else:
-                # No army center, just use strategic value
-                return strategic_value
+        scores = self._get_priority_array(objective_system)[indices]
 
-        # Sort by score (highest first)
-        bases = sorted(bases, key=score_base, reverse=True)
-        return bases[0]
+        if army_center_x is not None:
+            offsets = objective_system.bases_xy[indices] - (army_center_x, army_center_y)
+            distances = np.sqrt(np.sum(offsets * offsets, axis=1))
+            # Normalize distance: divide by 1000 to get a 0-3 range typically
+            # Add 0.5 to prevent division by zero and avoid over-prioritizing super close bases
+            scores = scores / (distances / 1000.0 + 0.5)
 
-    def _calculate_army_center(self, entity_manager):
-        """Calculate center of mass of army (officers + general)"""
-        if not entity_manager:
-            return None, None
+        # Highest score wins (first base on ties)
+        return objective_system.bases[indices[np.argmax(scores)]]
 
-        officers = [e for e in entity_manager.get_entities_with_tag("officer")
-                   if e.active and e.has_tag(f"team_{self.team_id}")]
+    def _compute_center(self, officers):
+        """
+        Sum officer positions, at most once per game tick.
+        Returns (sum_x, sum_y, count); cached against self.game_time.
+        """
+        sum_x, sum_y, count, cached_time = self._center_cache
+        if cached_time == self.game_time:
+            return sum_x, sum_y, count
 
-        generals = [e for e in entity_manager.get_entities_with_tag("general")
-                   if e.active and e.has_tag(f"team_{self.team_id}")]
+        sum_x = 0.0
+        sum_y = 0.0
+        count = 0
+        for officer in officers:
+            transform = officer.transform
+            if transform:
+                sum_x += transform.x
+                sum_y += transform.y
+                count += 1
 
-        all_commanders = officers + generals
+        self._center_cache = (sum_x, sum_y, count, self.game_time)
+        return sum_x, sum_y, count
 
-        if not all_commanders:
+    def _calculate_officer_center(self, officers):
+        """Calculate center of mass of officers (None, None if there are none)"""
+        sum_x, sum_y, count = self._compute_center(officers)
+        if count == 0:
             return None, None
+        return sum_x / count, sum_y / count
 
-        total_x = 0
-        total_y = 0
-        count = 0
+    def _calculate_army_center(self, officers, generals):
+        """Calculate center of mass of army (officers + general)"""
+        total_x, total_y, count = self._compute_center(officers)
 
-        for commander in all_commanders:
-            transform = commander.get_component("Transform")
+        for general in generals:
+            transform = general.transform
             if transform:
                 total_x += transform.x
                 total_y += transform.y
@@ -220,26 +311,18 @@ class GeneralAI:
 
     def choose_defensive_position(self, objective_system):
         """Choose best base to defend"""
-        if self.team_id == 0:
-            our_bases = objective_system.get_player_bases()
-        else:
-            our_bases = objective_system.get_enemy_bases()
+        our_bases = objective_system.get_team_bases(self.team_id)
 
         if not our_bases:
             return None
 
-        # Defend highest-value base we own
-        our_bases = sorted(our_bases,
-                          key=lambda b: self.objective_priorities.get(b.name, 1.0),
-                          reverse=True)
-        return our_bases[0]
+        # Defend highest-value base we own (first one on ties)
+        priorities = self._get_priority_array(objective_system)
+        return max(our_bases, key=lambda b: priorities[b.base_id])
 
-    def assign_squads_to_objectives(self, entity_manager):
+    def assign_squads_to_objectives(self, officers, priorities):
         """Assign officer squads to tactical objectives"""
-        officers = [e for e in entity_manager.get_entities_with_tag("officer")
-                   if e.active and e.has_tag(f"team_{self.team_id}")]
-
-        strategic_goal = self.blackboard.get_strategic_goal(self.team_id)
+        strategic_goal = self._tick_goal
         if not strategic_goal:
             return
 
@@ -251,32 +334,66 @@ class GeneralAI:
         total_officers = len(officers)
         reserve_count = max(1, int(total_officers * 0.3))  # 30% reserve
 
-        # Keep some squads in reserve (if not desperate)
-        if self.current_strategy != "desperate_attack":
-            self.reserve_squads = officers[:reserve_count]
-            self.active_squads = officers[reserve_count:]
+        goal = (self.current_strategy, target.name)
+        if goal != self._last_goal:
+            # New goal - re-split and order every active squad
+            self._last_goal = goal
+
+            # Keep some squads in reserve (if not desperate)
+            if self.current_strategy != Order.DESPERATE_ATTACK:
+                self.reserve_squads = officers[:reserve_count]
+                self.active_squads = officers[reserve_count:]
+            else:
+                self.reserve_squads = []
+                self.active_squads = officers
+            newly_active = self.active_squads
         else:
-            self.reserve_squads = []
-            self.active_squads = officers
+            # Same goal - active squads already have their orders, only place newcomers
+            newly_active = self._rebalance_squads(officers, reserve_count)
 
         # Assign active squads to target
-        for officer in self.active_squads:
-            unit = officer.get_component("Unit")
+        for officer in newly_active:
+            unit = officer.unit
             if unit and unit.squad_id:
                 # Officer receives order via blackboard
                 order = {
                     "type": self.current_strategy,
                     "target": (target.x, target.y),
-                    "priority": self.objective_priorities.get(target.name, 1.0)
+                    "priority": float(priorities[target.base_id])
                 }
                 self.blackboard.issue_order(
                     officer.id, order, "general_to_officer", self.game_time
                 )
 
+    def _rebalance_squads(self, officers, reserve_count):
+        """
+        Keep the reserve/active split stable: drop officers that are gone and
+        place new ones, topping up the reserve first (unless desperate).
+        Returns the officers that were newly made active.
+        """
+        present = set(officers)
+        self.reserve_squads = [o for o in self.reserve_squads if o in present]
+        self.active_squads = [o for o in self.active_squads if o in present]
+
+        known = set(self.reserve_squads)
+        known.update(self.active_squads)
+
+        newly_active = []
+        for officer in officers:
+            if officer in known:
+                continue
+            if self.current_strategy != Order.DESPERATE_ATTACK and len(self.reserve_squads) < reserve_count:
+                self.reserve_squads.append(officer)
+            else:
+                self.active_squads.append(officer)
+                newly_active.append(officer)
+
+        return newly_active
+
     def should_commit_reserves(self):
         """Check if conditions warrant committing reserves"""
         team_stats = self.blackboard.get_team_stats(self.team_id)
-        enemy_stats = self.blackboard.get_team_stats(1 - self.team_id)
+        enemy_stats = self.blackboard.get_team_stats(self.enemy_team_id)
 
         # Commit if numerically inferior
         if team_stats["total_units"] < enemy_stats["total_units"] * 0.8:
@@ -294,68 +411,43 @@ class GeneralAI:
             officer = self.reserve_squads.pop(0)
             self.active_squads.append(officer)
             # Issue order to newly committed squad
-            strategic_goal = self.blackboard.get_strategic_goal(self.team_id)
+            strategic_goal = self._tick_goal
             if strategic_goal and strategic_goal["target"]:
                 target = strategic_goal["target"]
                 order = {
-                    "type": "attack",  # Reserves commit aggressively
+                    "type": Order.ATTACK,  # Reserves commit aggressively
                     "target": (target.x, target.y),
                     "priority": 2.0  # High priority
                 }
                 self.blackboard.issue_order(officer.id, order, "general_to_officer", self.game_time)
 
-    def check_repositioning_needed(self, entity_manager, general_entity, objective_system):
+    def check_repositioning_needed(self, officers, general_entity, objective_system):
         """Check if general needs to reposition based on strategic situation"""
         if not self.current_position:
             return
 
         # Calculate ideal position (center of mass of officers)
-        officers = [e for e in entity_manager.get_entities_with_tag("officer")
-                   if e.active and e.has_tag(f"team_{self.team_id}")]
-
-        if not officers:
+        center_x, center_y = self._calculate_officer_center(officers)
+        if center_x is None:
             return  # No officers, stay put
 
-        # Calculate center of mass
-        total_x = 0
-        total_y = 0
-        count = 0
-
-        for officer in officers:
-            transform = officer.get_component("Transform")
-            if transform:
-                total_x += transform.x
-                total_y += transform.y
-                count += 1
-
-        if count == 0:
-            return
-
-        center_x = total_x / count
-        center_y = total_y / count
-
-        # Calculate distance from current position to center
+        # Calculate squared distance from current position to center
         dx = center_x - self.current_position[0]
         dy = center_y - self.current_position[1]
-        distance = math.sqrt(dx*dx + dy*dy)
+        dist_sq = dx*dx + dy*dy
 
         # Check triggers for repositioning
-        current_owned_bases = len(objective_system.get_player_bases() if self.team_id == 0
-                                  else objective_system.get_enemy_bases())
+        current_owned_bases = len(objective_system.get_team_bases(self.team_id))
 
         # Trigger 1: Lost bases
         base_lost = current_owned_bases < self.last_owned_bases
         self.last_owned_bases = current_owned_bases
 
         # Trigger 2: Army center of mass shifted significantly
-        army_shifted = distance > self.repositioning_threshold
-
         # Trigger 3: General is very far from army
-        general_too_far = distance > 600
-
-        if base_lost or army_shifted or general_too_far:
+        if base_lost or dist_sq > self._reposition_dist_sq:
             # Reposition general to center of officers (stay slightly behind)
-            strategic_goal = self.blackboard.get_strategic_goal(self.team_id)
+            strategic_goal = self._tick_goal
             if strategic_goal and strategic_goal["target"]:
                 target = strategic_goal["target"]
                 # Position between officers and objective (closer to officers)
@@ -366,7 +458,25 @@ class GeneralAI:
                 target_y = center_y
 
             self.target_position = (target_x, target_y)
-            print(f"[GENERAL TEAM {self.team_id}] Repositioning! Triggers: base_lost={base_lost}, shifted={army_shifted}, too_far={general_too_far}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[GENERAL TEAM %s] Repositioning! Triggers: base_lost=%s, shifted=%s, too_far=%s",
+                             self.team_id, base_lost,
+                             dist_sq > self.repositioning_threshold ** 2,
+                             dist_sq > self.max_distance_from_army ** 2)
+
+    def _get_heading(self, key, dx, dy, dist_sq, speed):
+        """
+        Velocity of magnitude speed along (dx, dy). Only re-normalized when the
+        destination key changes or every HEADING_REFRESH_FRAMES calls; the general
+        moves slowly enough that the stale direction in between is invisible.
+        """
+        if key != self._heading_key or self._heading_age >= HEADING_REFRESH_FRAMES:
+            inv = speed / sqrt(dist_sq)
+            self._heading = (dx * inv, dy * inv)
+            self._heading_key = key
+            self._heading_age = 0
+        self._heading_age += 1
+        return self._heading
 
     def move_general_to_position(self, transform, dt):
         """Move general toward target position"""
@@ -375,34 +485,33 @@ class GeneralAI:
 
         dx = self.target_position[0] - transform.x
         dy = self.target_position[1] - transform.y
-        distance = math.sqrt(dx*dx + dy*dy)
+        dist_sq = dx*dx + dy*dy
 
         # Stop if close enough
-        if distance < 50:
+        if dist_sq < 50 * 50:
             transform.vx = 0
             transform.vy = 0
             self.target_position = None  # Repositioning complete
-            print(f"[GENERAL TEAM {self.team_id}] Repositioning complete")
+            self._heading_key = None
+            logger.debug("[GENERAL TEAM %s] Repositioning complete", self.team_id)
             return
 
-        # Move slowly toward target
+        # Move slowly toward target (dist_sq >= 50^2 here, so never zero)
         general_speed = 50  # Generals move slowly
-        if distance > 0:
-            direction_x = dx / distance
-            direction_y = dy / distance
-            transform.vx = direction_x * general_speed
-            transform.vy = direction_y * general_speed
+        transform.vx, transform.vy = self._get_heading(
+            self.target_position, dx, dy, dist_sq, general_speed
+        )
 
-            # Apply movement
-            transform.x += transform.vx * dt
-            transform.y += transform.vy * dt
+        # Apply movement
+        transform.x += transform.vx * dt
+        transform.y += transform.vy * dt
 
-    def drift_toward_objective(self, entity_manager, transform, dt):
+    def drift_toward_objective(self, officers, transform, dt):
         """Gently drift toward strategic objective when not actively repositioning"""
         if not transform:
             return
 
-        strategic_goal = self.blackboard.get_strategic_goal(self.team_id)
+        strategic_goal = self._tick_goal
         if not strategic_goal or not strategic_goal["target"]:
             transform.vx = 0
             transform.vy = 0
@@ -411,33 +520,12 @@ class GeneralAI:
         target = strategic_goal["target"]
 
         # Calculate center of mass of officers
-        officers = [e for e in entity_manager.get_entities_with_tag("officer")
-                   if e.active and e.has_tag(f"team_{self.team_id}")]
-
-        if not officers:
+        center_x, center_y = self._calculate_officer_center(officers)
+        if center_x is None:
             transform.vx = 0
             transform.vy = 0
             return
 
-        # Calculate officer center
-        officer_x_sum = 0
-        officer_y_sum = 0
-        count = 0
-        for officer in officers:
-            off_transform = officer.get_component("Transform")
-            if off_transform:
-                officer_x_sum += off_transform.x
-                officer_y_sum += off_transform.y
-                count += 1
-
-        if count == 0:
-            transform.vx = 0
-            transform.vy = 0
-            return
-
-        center_x = officer_x_sum / count
-        center_y = officer_y_sum / count
-
         # Position 70% toward officers, 30% toward objective (stay behind but advance)
         ideal_x = center_x * 0.7 + target.x * 0.3
         ideal_y = center_y * 0.7 + target.y * 0.3
@@ -445,14 +533,13 @@ class GeneralAI:
         # Move toward ideal position if far enough
         dx = ideal_x - transform.x
         dy = ideal_y - transform.y
-        distance = math.sqrt(dx*dx + dy*dy)
+        dist_sq = dx*dx + dy*dy
 
-        if distance > 200:  # Only move if significantly far
+        if dist_sq > 200 * 200:  # Only move if significantly far
             general_drift_speed = 30  # Very slow drift
-            direction_x = dx / distance
-            direction_y = dy / distance
-            transform.vx = direction_x * general_drift_speed
-            transform.vy = direction_y * general_drift_speed
+            transform.vx, transform.vy = self._get_heading(
+                target, dx, dy, dist_sq, general_drift_speed
+            )
 
             transform.x += transform.vx * dt
             transform.y += transform.vy * dt
@@ -460,6 +547,7 @@ class GeneralAI:
             # Close enough, hold position
             transform.vx = 0
             transform.vy = 0
+            self._heading_key = None
 
 
 class OfficerAI:
@@ -477,8 +565,18 @@ class OfficerAI:
         self.entity_manager = entity_manager
 
         # Tactical state
-        self.current_order = None  # "attack", "defend", "move", "retreat"
+        self.current_order = None  # Order member (ATTACK, DEFEND, MOVE, RETREAT, ...)
         self.target_position = None
+        self._matched_target = None  # target_position the cached base lookup was made for
+        self._matched_base = None    # Base at _matched_target (None if not a base)
+        self._tick_goal = None       # Team strategic goal, fetched once per tick
+
+        # (x, y, roster_version, formation type, looseness) the soldiers' formation slots were last assigned for
+        self._formation_key = None
+
+        # Memo of the last near-base priority evaluation (see get_tactical_priorities)
+        self._priority_key = None
+        self._priority_val = None
         self.formation_type = "line"
 
         # Threat evaluation
@@ -504,12 +602,28 @@ class OfficerAI:
         self.max_scout_percent = 0.10  # 10% max
         self.min_squad_for_scouts = 5  # Need at least 5 soldiers
 
+    def stagger_decisions(self, slot):
+        """
+        Offset periodic decision timers by slot (e.g. creation order) so that
+        officers created together don't all evaluate on the same frame.
+        """
+        phase = (slot * DECISION_PHASE_STEP) % 1.0
+        self.evaluation_timer = self.evaluation_cooldown * phase
+        self.scout_decision_timer = self.scout_decision_cooldown * phase
+
     def update(self, dt, entity_manager, officer_entity, game_time=0.0, objective_system=None):
-        """Update tactical decision making"""
+        """
+        Update tactical decision making.
+        Returns True if the officer set a velocity to be integrated this tick
+        (see ArmyManager._update_officers, which also refreshes squad formations).
+        """
         self.game_time = game_time
         self.evaluation_timer += dt
         self.entity_manager = entity_manager
 
+        unit = officer_entity.unit
+        self._tick_goal = self.blackboard.get_strategic_goal(unit.team) if unit else None
+
         # Check for new orders from general
         orders = self.blackboard.get_orders_for_unit(officer_entity.id, self.game_time)
         for order in orders:
@@ -526,11 +640,8 @@ class OfficerAI:
             self.scout_decision_timer = 0.0
             self.manage_scouts(entity_manager, officer_entity)
 
-        # CRITICAL: Move officer toward target objective (with threat-based tactics)
-        self.move_toward_objective(officer_entity, dt, objective_system)
-
-        # Update formation positions
-        self.update_squad_formation(entity_manager, officer_entity)
+        # CRITICAL: Steer officer toward target objective (with threat-based tactics)
+        return self.move_toward_objective(officer_entity, dt, objective_system)
 
     def process_order(self, order):
         """Process order from general"""
@@ -539,7 +650,8 @@ class OfficerAI:
 
         # Debug output
         if self.target_position:
-            print(f"[OFFICER {self.squad_id}] Received order: {self.current_order}, Target: ({int(self.target_position[0])}, {int(self.target_position[1])})")
+            logger.debug("[OFFICER %s] Received order: %s, Target: (%d, %d)",
+                         self.squad_id, self.current_order.name, self.target_position[0], self.target_position[1])
 
         # Change formation based on order
         self.formation_manager.change_formation_for_order(self.squad_id, self.current_order)
@@ -548,8 +660,8 @@ class OfficerAI:
         """
         Evaluate local situation and make tactical decisions.
         """
-        transform = officer_entity.get_component("Transform")
-        unit = officer_entity.get_component("Unit")
+        transform = officer_entity.transform
+        unit = officer_entity.unit
 
         if not transform or not unit:
             return
@@ -580,7 +692,7 @@ class OfficerAI:
 
         # Decision: Should we retreat?
         if threat_ratio > self.retreat_threshold or squad_morale < 0.3:
-            if self.current_order != "retreat":
+            if self.current_order != Order.RETREAT:
                 self.initiate_retreat()
 
         # Decision: Should we request reinforcements?
@@ -594,14 +706,14 @@ class OfficerAI:
 
     def initiate_retreat(self):
         """Tactical retreat"""
-        self.current_order = "retreat"
+        self.current_order = Order.RETREAT
         # TODO: Find safe fallback position
-        self.formation_manager.change_formation_for_order(self.squad_id, "move")
+        self.formation_manager.change_formation_for_order(self.squad_id, Order.MOVE)
 
     def request_reinforcements(self, officer_entity):
         """Request reinforcements from general"""
-        transform = officer_entity.get_component("Transform")
-        unit = officer_entity.get_component("Unit")
+        transform = officer_entity.transform
+        unit = officer_entity.unit
 
         if transform and unit:
             # Write request to blackboard
@@ -618,20 +730,20 @@ class OfficerAI:
             return False
 
         squad_size = len(squad_info["soldier_ids"])
-        squad_morale = unit.morale if hasattr(unit, 'morale') else 1.0
+        squad_morale = unit.morale
 
         # Join combat if:
         # 1. Threat is high AND morale is decent (officer inspires troops)
         # 2. Threat is medium AND squad is small (need every fighter)
         # 3. Morale is low (officer leads by example to boost morale)
 
-        if threat_level == "overwhelming":
+        if threat_level == Threat.OVERWHELMING:
             # Too dangerous - officer should not risk themselves
             return False
-        elif threat_level == "high":
+        elif threat_level == Threat.HIGH:
             # Only join if morale is good (can turn the tide)
             return squad_morale > 0.6
-        elif threat_level == "medium":
+        elif threat_level == Threat.MEDIUM:
             # Join if squad is small
             return squad_size < 6
         elif squad_morale < 0.4:
@@ -641,15 +753,32 @@ class OfficerAI:
             # Low threat, good morale - stay back and command
             return False
 
+    def get_tactical_priorities(self, capture_progress, threat_level, unit):
+        """
+        (capture, combat, retreat) priorities near a base.
+        Memoized on the inputs, which stay the same across ticks while a base is
+        not changing hands and the squad's morale is steady.
+        """
+        key = (threat_level, capture_progress, unit.team, unit.morale)
+        if key != self._priority_key:
+            self._priority_key = key
+            self._priority_val = (
+                self.calculate_capture_priority(capture_progress, threat_level, unit.team),
+                self.calculate_combat_priority(threat_level, unit),
+                self.calculate_retreat_priority(threat_level, unit)
+            )
+        return self._priority_val
+
     def calculate_capture_priority(self, capture_progress, threat_level, team):
         """Calculate capture priority with exponential scaling (0%=1.0x, 50%=2.5x, 90%=4.0x)"""
         # Normalize progress for this team (0.0-1.0 where 1.0 = fully captured by this team)
         if team == 0:
             # Team 0: progress > 0.7 = owned, closer to 1.0 = more complete
-            team_progress = max(0, (capture_progress - 0.5) * 2.0)  # Map 0.5-1.0 to 0.0-1.0
+            team_progress = capture_progress - 0.5  # Map 0.5-1.0 to 0-100%
         else:
             # Team 1: progress < 0.3 = owned, closer to 0.0 = more complete
-            team_progress = max(0, (0.5 - capture_progress) * 2.0)  # Map 0.5-0.0 to 0.0-1.0
+            team_progress = 0.5 - capture_progress  # Map 0.5-0.0 to 0-100%
+        percent = max(0, int(team_progress * 200.0 + 0.5))
 
         # Exponential progress bonus: bonus = 1.0 + progress^2 * 3.0
         # At 0%: 1.0 + 0.0 = 1.0x
@@ -657,16 +786,10 @@ class OfficerAI:
         # At 70%: 1.0 + 0.49 * 3.0 = 2.47x
         # At 90%: 1.0 + 0.81 * 3.0 = 3.43x
         # At 100%: 1.0 + 1.0 * 3.0 = 4.0x
-        progress_bonus = 1.0 + (team_progress ** 2) * 3.0
+        progress_bonus = CAPTURE_PROGRESS_BONUS[percent]
 
         # Threat penalty
-        threat_modifiers = {
-            "low": 0.0,
-            "medium": 0.3,
-            "high": 0.6,
-            "overwhelming": 1.0
-        }
-        threat_penalty = threat_modifiers.get(threat_level, 0.5)
+        threat_penalty = CAPTURE_THREAT_PENALTY[threat_level]
 
         base_priority = 1.0
         final_priority = base_priority * progress_bonus * (1.0 - threat_penalty)
@@ -675,35 +798,33 @@ class OfficerAI:
 
     def calculate_combat_priority(self, threat_level, unit):
         """Calculate combat priority based on threat"""
-        squad_morale = unit.morale if hasattr(unit, 'morale') else 1.0
+        squad_morale = unit.morale
 
-        if threat_level == "low":
-            return 0.3  # Can mostly ignore
-        elif threat_level == "medium":
-            return 0.8  # Should fight but not critical
-        elif threat_level == "high":
-            return 1.5 * squad_morale  # Must fight if morale is good
-        else:  # overwhelming
-            return 0.0  # Don't fight, retreat!
+        # low: can mostly ignore, medium: fight but not critical,
+        # high: must fight if morale is good, overwhelming: don't fight, retreat!
+        priority = COMBAT_THREAT_PRIORITY[threat_level]
+        if threat_level == Threat.HIGH:
+            priority *= squad_morale
+        return priority
 
     def calculate_retreat_priority(self, threat_level, unit):
         """Calculate retreat priority based on threat and morale"""
-        squad_morale = unit.morale if hasattr(unit, 'morale') else 1.0
+        squad_morale = unit.morale
 
-        if threat_level == "overwhelming":
+        if threat_level == Threat.OVERWHELMING:
             return 2.0  # Always retreat
-        elif threat_level == "high" and squad_morale < 0.4:
+        elif threat_level == Threat.HIGH and squad_morale < 0.4:
             return 1.8  # Morale broken
-        elif threat_level == "medium" and squad_morale < 0.2:
+        elif threat_level == Threat.MEDIUM and squad_morale < 0.2:
             return 1.5  # Panic retreat
         else:
             return 0.0  # Hold ground
 
     def should_abandon_objective(self, threat_level, unit):
         """Decide if objective should be abandoned due to overwhelming odds"""
-        if threat_level == "overwhelming":
+        if threat_level == Threat.OVERWHELMING:
             # Check morale - broken units always retreat
-            squad_morale = unit.morale if hasattr(unit, 'morale') else 1.0
+            squad_morale = unit.morale
             if squad_morale < 0.3:
                 return True  # Morale broken, retreat
 
@@ -715,112 +836,120 @@ class OfficerAI:
         return False  # Don't abandon unless overwhelming
 
     def move_toward_objective(self, officer_entity, dt, objective_system=None):
-        """Move officer toward assigned objective with threat-based tactics"""
-        transform = officer_entity.get_component("Transform")
-        unit = officer_entity.get_component("Unit")
+        """
+        Steer officer toward assigned objective with threat-based tactics.
+        Sets the officer's velocity and returns True if it should move this tick;
+        ArmyManager integrates all moving officers in one pass afterwards.
+        """
+        transform = officer_entity.transform
+        unit = officer_entity.unit
 
         if not transform or not unit:
-            return
+            return False
 
         # CHECK: Is current objective already captured by our team?
         if self.target_position and objective_system:
-            # Find which base we're targeting
-            target_x, target_y = self.target_position
-            for base in objective_system.bases:
-                dx = base.x - target_x
-                dy = base.y - target_y
-                if math.sqrt(dx*dx + dy*dy) < 50:  # This is our target base
-                    # Check if we already own it
-                    if base.owner == unit.team:
-                        print(f"[OFFICER {self.squad_id}] Objective {base.name} already captured! Looking for new target...")
-                        self.target_position = None
-                        break
+            # Find which base we're targeting (only re-queried when the target changes)
+            if self.target_position != self._matched_target:
+                self._matched_target = self.target_position
+                self._matched_base = objective_system.find_base_at(*self.target_position)
+
+            base = self._matched_base
+            # Check if we already own it
+            if base and base.owner == unit.team:
+                logger.debug("[OFFICER %s] Objective %s already captured! Looking for new target...",
+                             self.squad_id, base.name)
+                self.target_position = None
 
         # FALLBACK: If no target assigned, look for strategic goal from blackboard
         if not self.target_position:
-            strategic_goal = self.blackboard.get_strategic_goal(unit.team)
+            strategic_goal = self._tick_goal
             if strategic_goal and strategic_goal["target"]:
                 target = strategic_goal["target"]
                 # Only adopt target if we don't already own it
                 if target.owner != unit.team:
                     self.target_position = (target.x, target.y)
                     self.current_order = strategic_goal["objective"]
-                    print(f"[OFFICER {self.squad_id}] Adopting strategic goal: {self.current_order} -> {target.name}")
+                    logger.debug("[OFFICER %s] Adopting strategic goal: %s -> %s",
+                                 self.squad_id, self.current_order.name, target.name)
                 else:
-                    print(f"[OFFICER {self.squad_id}] Strategic target {target.name} already owned, waiting for new orders...")
+                    logger.debug("[OFFICER %s] Strategic target %s already owned, waiting for new orders...",
+                                 self.squad_id, target.name)
 
         if not self.target_position:
             # Still no target - defensive idle
             transform.vx = 0
             transform.vy = 0
-            return
+            return False
+
+        # Local copies of hot attributes
+        tx = transform.x
+        ty = transform.y
+        squad_id = self.squad_id
+        change_formation = self.formation_manager.change_formation_for_order
 
         # Calculate direction to target
         target_x, target_y = self.target_position
-        dx = target_x - transform.x
-        dy = target_y - transform.y
-        distance = math.sqrt(dx*dx + dy*dy)
+        dx = target_x - tx
+        dy = target_y - ty
+        dist_sq = dx*dx + dy*dy
 
         # Check threat level at current position
         threat_level = self.blackboard.calculate_threat_level(
-            unit.team, transform.x, transform.y, 300, self.entity_manager
+            unit.team, tx, ty, 300, self.entity_manager
         )
 
         # TACTICAL DECISION: Are we near a base?
         near_base = False
         nearest_base = None
-        base_distance = float('inf')
+        base_dist_sq = float('inf')
 
         if objective_system:
-            for base in objective_system.bases:
-                base_dx = base.x - transform.x
-                base_dy = base.y - transform.y
-                base_dist = math.sqrt(base_dx*base_dx + base_dy*base_dy)
+            for base in objective_system.get_bases_near(tx, ty):
+                base_dx = base.x - tx
+                base_dy = base.y - ty
+                dist_to_base_sq = base_dx*base_dx + base_dy*base_dy
 
-                if base_dist < base.radius + 150:  # Within capture proximity
+                if dist_to_base_sq < base.approach_radius_sq:  # Within capture proximity
                     near_base = True
-                    if base_dist < base_distance:
+                    if dist_to_base_sq < base_dist_sq:
                         nearest_base = base
-                        base_distance = base_dist
+                        base_dist_sq = dist_to_base_sq
 
         # TACTICAL FORMATION SWITCHING WITH EXPONENTIAL CAPTURE PRIORITY
         if near_base and nearest_base:
-            # Calculate capture priority (exponential with progress)
-            capture_priority = self.calculate_capture_priority(
-                nearest_base.capture_progress, threat_level, unit.team
+            # Calculate capture priority (exponential with progress), combat and retreat priorities
+            capture_priority, combat_priority, retreat_priority = self.get_tactical_priorities(
+                nearest_base.capture_progress, threat_level, unit
             )
-            combat_priority = self.calculate_combat_priority(threat_level, unit)
-            retreat_priority = self.calculate_retreat_priority(threat_level, unit)
 
             # Decide action based on priorities
             if retreat_priority > capture_priority and retreat_priority > combat_priority:
                 # RETREAT
-                print(f"[TACTICAL] {self.squad_id} retreating! (retreat_priority={retreat_priority:.2f})")
+                logger.debug("[TACTICAL] %s retreating! (retreat_priority=%.2f)", squad_id, retreat_priority)
                 self.target_position = None
-                return
+                return False
             elif combat_priority > capture_priority:
                 # COMBAT - abandon capture, fight enemies
-                print(f"[TACTICAL] {self.squad_id} prioritizing combat over capture (combat={combat_priority:.2f} vs capture={capture_priority:.2f})")
-                self.formation_manager.change_formation_for_order(self.squad_id, "defend")
+                logger.debug("[TACTICAL] %s prioritizing combat over capture (combat=%.2f vs capture=%.2f)",
+                             squad_id, combat_priority, capture_priority)
+                change_formation(squad_id, Order.DEFEND)
                 # Don't move toward base, hold position or engage
             else:
                 # CAPTURE - continue toward objective
-                if threat_level == "low":
+                base_center = (nearest_base.x, nearest_base.y)
+                if threat_level == Threat.LOW:
                     # Spread out for maximum capture
-                    self.formation_manager.change_formation_for_order(self.squad_id, "capture")
+                    change_formation(squad_id, Order.CAPTURE)
                     # Always move to base center for optimal capture positioning
-                    self.target_position = (nearest_base.x, nearest_base.y)
-                elif threat_level == "medium":
-                    # Defensive formation but still capture
-                    self.formation_manager.change_formation_for_order(self.squad_id, "defend")
-                    # Move toward base but maintain defensive posture
-                    if base_distance > nearest_base.radius * 0.3:
-                        self.target_position = (nearest_base.x, nearest_base.y)
+                    self.target_position = base_center
                 else:
-                    # High threat but capture priority is still higher - defensive capture
-                    self.formation_manager.change_formation_for_order(self.squad_id, "defend")
-                    if base_distance > nearest_base.radius * 0.3:
-                        self.target_position = (nearest_base.x, nearest_base.y)
+                    # Medium threat: defensive formation but still capture
+                    # High threat (capture priority still higher): defensive capture
+                    change_formation(squad_id, Order.DEFEND)
+                    # Move toward base but maintain defensive posture
+                    if base_dist_sq > nearest_base.hold_radius_sq:
+                        self.target_position = base_center
 
         # Decide if officer should participate in combat or stay back
         self.should_officer_join_combat = self.calculate_combat_participation(threat_level, unit)
@@ -830,28 +959,21 @@ class OfficerAI:
 
         # Stop if close enough to target (smaller threshold when capturing)
         stop_distance = 30 if near_base else 100  # Get closer to base centers
-        if distance < stop_distance:
+        if dist_sq < stop_distance * stop_distance:
             transform.vx = 0
             transform.vy = 0
-            return
+            return False
 
-        # Move toward target
+        # Move toward target (dist_sq >= stop_distance^2 here, so never zero)
         officer_speed = 80  # Officers move slower than soldiers to maintain formation
-        if distance > 0:
-            direction_x = dx / distance
-            direction_y = dy / distance
-
-            # Apply officer offset (stay slightly behind)
-            transform.vx = direction_x * officer_speed
-            transform.vy = direction_y * officer_speed
-
-            # Apply movement
-            transform.x += transform.vx * dt
-            transform.y += transform.vy * dt
+        inv = officer_speed / sqrt(dist_sq)
+        transform.vx = dx * inv
+        transform.vy = dy * inv
+        return True
 
     def update_squad_formation(self, entity_manager, officer_entity):
         """Update formation positions for squad soldiers"""
-        transform = officer_entity.get_component("Transform")
+        transform = officer_entity.transform
         if not transform:
             return
 
@@ -865,6 +987,14 @@ class OfficerAI:
         if not squad_info:
             return
 
+        # Slots only change when the officer moves, the roster changes or the formation changes
+        formation = self.formation_manager.formations.get(self.squad_id)
+        if formation:
+            key = (transform.x, transform.y, squad_info["roster_version"], formation.type, formation.looseness)
+            if key == self._formation_key:
+                return
+            self._formation_key = key
+
         soldier_ids = squad_info["soldier_ids"]
 
         # Get formation positions
@@ -874,22 +1004,16 @@ class OfficerAI:
 
         # Assign positions to each soldier's Unit component
         for soldier_id, (form_x, form_y) in zip(soldier_ids, formation_positions):
-            # Find soldier entity
-            soldier = None
-            for e in entity_manager.entities:
-                if e.id == soldier_id and e.active:
-                    soldier = e
-                    break
-
-            if soldier:
-                unit = soldier.get_component("Unit")
+            soldier = entity_manager.get_entity(soldier_id)
+            if soldier and soldier.active:
+                unit = soldier.unit
                 if unit:
                     unit.formation_position = (form_x, form_y)
 
     def manage_scouts(self, entity_manager, officer_entity):
         """Manage scout deployment based on threat and squad size"""
-        transform = officer_entity.get_component("Transform")
-        unit = officer_entity.get_component("Unit")
+        transform = officer_entity.transform
+        unit = officer_entity.unit
 
         if not transform or not unit:
             return
@@ -915,13 +1039,13 @@ class OfficerAI:
             if max_scouts > 0:
                 self.deploy_scouts(soldier_ids[:max_scouts], transform)
                 self.scouts_deployed = True
-                print(f"[OFFICER {self.squad_id}] Deployed {max_scouts} scouts (squad size: {squad_size})")
+                logger.debug("[OFFICER %s] Deployed %d scouts (squad size: %d)", self.squad_id, max_scouts, squad_size)
 
         elif not should_deploy and self.scouts_deployed:
             # Recall scouts
             self.blackboard.recall_scouts(self.squad_id)
             self.scouts_deployed = False
-            print(f"[OFFICER {self.squad_id}] Recalled scouts (threat level: {threat_level})")
+            logger.debug("[OFFICER %s] Recalled scouts (threat level: %s)", self.squad_id, threat_level.name)
 
     def calculate_max_scouts(self, squad_size):
         """Calculate maximum number of scouts allowed"""
@@ -938,7 +1062,7 @@ class OfficerAI:
 
         # Deploy scouts when threat is low or medium
         # Don't deploy during high threat or combat
-        return threat_level in ["low", "medium"]
+        return threat_level <= Threat.MEDIUM
 
     def deploy_scouts(self, scout_ids, officer_transform):
         """Deploy scouts with patrol positions around officer"""
@@ -946,15 +1070,15 @@ class OfficerAI:
         if num_scouts == 0:
             return
 
-        patrol_positions = []
         patrol_radius = 250  # Scouts patrol 250 pixels from officer
+        center_x = officer_transform.x
+        center_y = officer_transform.y
 
         # Scouts patrol in circle around officer
-        for i in range(num_scouts):
-            angle = (i / num_scouts) * 2 * math.pi
-            patrol_x = officer_transform.x + math.cos(angle) * patrol_radius
-            patrol_y = officer_transform.y + math.sin(angle) * patrol_radius
-            patrol_positions.append((patrol_x, patrol_y))
+        patrol_positions = [
+            (center_x + cos_a * patrol_radius, center_y + sin_a * patrol_radius)
+            for cos_a, sin_a in get_ring_offsets(num_scouts)
+        ]
 
         # Assign scouts to blackboard
         self.blackboard.assign_scouts(self.squad_id, scout_ids, patrol_positions)
@@ -2,9 +2,13 @@
 Army deployment system
 Sets up initial armies on both sides of the map
 """
-from game.army_units import create_soldier, create_officer, create_general
+from game.army_units import create_soldiers_batch, create_officer, create_general
 from game.formation import FormationType
-import random
+import heapq
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 
 class ArmyDeployment:
@@ -21,6 +25,9 @@ class ArmyDeployment:
         self.reinforcement_timer = 0.0
         self.reinforcements_per_wave = 5
 
+        # Batched position jitter for deployment and reinforcement waves
+        self._rng = np.random.default_rng()
+
     def deploy_armies(self, world_width, world_height):
         """
         Deploy initial armies on both sides of map.
@@ -57,20 +64,23 @@ class ArmyDeployment:
         """
         # Create general with correct team
         general = create_general(self.entity_manager, base_x, center_y, team=team_id)
-        print(f"[DEPLOYMENT] Created General {general.id} for team {team_id} at ({base_x}, {center_y})")
+        logger.debug("[DEPLOYMENT] Created General %s for team %s at (%s, %s)", general.id, team_id, base_x, center_y)
 
         # Create officers in line formation
         officer_spacing = 400  # Vertical spacing between officer squads
         start_y = center_y - (num_officers - 1) * officer_spacing / 2
 
+        # Squad ids are "team<id>_squad<n>", built once per team
+        team_prefix = f"team{team_id}"
+        squad_ids = [f"{team_prefix}_squad{i}" for i in range(num_officers)]
+
         officers = []
-        for i in range(num_officers):
+        for i, squad_id in enumerate(squad_ids):
             officer_y = start_y + i * officer_spacing
             officer = create_officer(self.entity_manager, base_x, officer_y, team=team_id)
 
             # Register squad with blackboard
-            squad_id = f"team{team_id}_squad{i}"
-            self.blackboard.register_squad(squad_id, officer.id, formation="line")
+            self.blackboard.register_squad(squad_id, officer.id, formation="line", team_id=team_id)
 
             # Assign officer to squad
             unit = officer.get_component("Unit")
@@ -81,7 +91,7 @@ class ArmyDeployment:
             self.formation_manager.create_formation(squad_id, FormationType.LINE, looseness=0.3)
 
             officers.append((officer, squad_id, officer_y))
-            print(f"[DEPLOYMENT] Created Officer {officer.id} for squad {squad_id}")
+            logger.debug("[DEPLOYMENT] Created Officer %s for squad %s", officer.id, squad_id)
 
         # Deploy soldiers for each officer
         for officer, squad_id, officer_y in officers:
@@ -94,21 +104,24 @@ class ArmyDeployment:
         soldier_spacing = 50
         start_x = base_x - (count - 1) * soldier_spacing / 2
 
-        for i in range(count):
-            soldier_x = start_x + i * soldier_spacing
-            soldier_y = base_y + random.uniform(-20, 20)  # Slight Y variance
+        xs = np.linspace(start_x, start_x + (count - 1) * soldier_spacing, count)
+        ys = base_y + self._rng.uniform(-20, 20, count)  # Slight Y variance
 
-            soldier = create_soldier(self.entity_manager, soldier_x, soldier_y, team=team_id)
+        self._enlist_soldiers(team_id, squad_id, xs, ys)
 
-            # Assign to squad
-            self.blackboard.add_soldier_to_squad(squad_id, soldier.id)
+        logger.debug("[DEPLOYMENT] Deployed %d soldiers to %s", count, squad_id)
 
+    def _enlist_soldiers(self, team_id, squad_id, xs, ys):
+        """Create soldiers at (xs, ys) as one batch and assign them all to squad_id"""
+        soldiers = create_soldiers_batch(self.entity_manager, xs.tolist(), ys.tolist(), team=team_id)
+
+        self.blackboard.add_soldiers_to_squad(squad_id, [soldier.id for soldier in soldiers])
+
+        for soldier in soldiers:
             unit = soldier.get_component("Unit")
             if unit:
                 unit.squad_id = squad_id
 
-        print(f"[DEPLOYMENT] Deployed {count} soldiers to {squad_id}")
-
     def update(self, dt):
         """Update reinforcement timer"""
         self.reinforcement_timer += dt
@@ -119,7 +132,7 @@ class ArmyDeployment:
 
     def spawn_reinforcements(self):
         """Spawn reinforcement wave for both teams"""
-        print("[REINFORCEMENTS] Spawning reinforcement wave...")
+        logger.debug("[REINFORCEMENTS] Spawning reinforcement wave...")
 
         # Spawn for team 0
         self.spawn_team_reinforcements(0)
@@ -129,25 +142,35 @@ class ArmyDeployment:
 
     def spawn_team_reinforcements(self, team_id):
         """Spawn reinforcements for one team"""
-        # Find all squads for this team
+        # Find all squads for this team that can take soldiers (not full, officer on the field)
         team_squads = []
-        for squad_id, squad_data in self.blackboard.squad_assignments.items():
-            if squad_id.startswith(f"team{team_id}"):
-                current_size = len(squad_data["soldier_ids"])
-                max_size = squad_data["max_size"]
-                if current_size < max_size:
-                    team_squads.append((squad_id, current_size, max_size))
+        squad_assignments = self.blackboard.squad_assignments
+        for squad_id in self.blackboard.squads_by_team.get(team_id, ()):
+            squad_data = squad_assignments[squad_id]
+            current_size = len(squad_data["soldier_ids"])
+            max_size = squad_data["max_size"]
+            if current_size >= max_size:
+                continue
+
+            officer_entity = self.entity_manager.get_entity(squad_data["officer_id"])
+            officer_transform = officer_entity.get_component("Transform") if officer_entity else None
+            if officer_transform:
+                team_squads.append((squad_id, current_size, max_size, officer_transform))
 
         if not team_squads:
             return
 
-        # Sort by most depleted (lowest percentage of max)
-        team_squads.sort(key=lambda x: x[1] / x[2] if x[2] > 0 else 0)
+        # Most depleted first (lowest percentage of max). Every listed squad takes at
+        # least one soldier, so at most reinforcements_per_wave squads can be served
+        team_squads = heapq.nsmallest(
+            self.reinforcements_per_wave, team_squads,
+            key=lambda x: x[1] / x[2] if x[2] > 0 else 0
+        )
 
         # Distribute reinforcements
         reinforcements_left = self.reinforcements_per_wave
 
-        for squad_id, current_size, max_size in team_squads:
+        for squad_id, current_size, max_size, officer_transform in team_squads:
             if reinforcements_left <= 0:
                 break
 
@@ -155,35 +178,14 @@ class ArmyDeployment:
             capacity = max_size - current_size
             to_spawn = min(capacity, reinforcements_left)
 
-            # Find officer position for this squad
-            squad_data = self.blackboard.squad_assignments[squad_id]
-            officer_id = squad_data["officer_id"]
-
-            officer_entity = None
-            for e in self.entity_manager.entities:
-                if e.id == officer_id:
-                    officer_entity = e
-                    break
-
-            if officer_entity:
-                officer_transform = officer_entity.get_component("Transform")
-                if officer_transform:
-                    # Spawn soldiers near officer
-                    for i in range(to_spawn):
-                        spawn_x = officer_transform.x + random.uniform(-100, 100)
-                        spawn_y = officer_transform.y + random.uniform(-100, 100)
-
-                        soldier = create_soldier(self.entity_manager, spawn_x, spawn_y, team=team_id)
-
-                        # Assign to squad
-                        self.blackboard.add_soldier_to_squad(squad_id, soldier.id)
+            # Spawn soldiers near officer
+            xs = officer_transform.x + self._rng.uniform(-100, 100, to_spawn)
+            ys = officer_transform.y + self._rng.uniform(-100, 100, to_spawn)
 
-                        unit = soldier.get_component("Unit")
-                        if unit:
-                            unit.squad_id = squad_id
+            self._enlist_soldiers(team_id, squad_id, xs, ys)
 
-                    reinforcements_left -= to_spawn
-                    print(f"[REINFORCEMENTS] Spawned {to_spawn} soldiers for {squad_id}")
+            reinforcements_left -= to_spawn
+            logger.debug("[REINFORCEMENTS] Spawned %d soldiers for %s", to_spawn, squad_id)
 
     def setup_base_priorities(self, objective_system):
         """Set strategic values for bases"""
@@ -196,4 +198,4 @@ class ArmyDeployment:
 
             # Store in blackboard (both generals can read)
             # This would typically be done in GeneralAI, but we set defaults here
-            print(f"[DEPLOYMENT] Base '{base.name}' priority: {priority}x")
+            logger.debug("[DEPLOYMENT] Base '%s' priority: %sx", base.name, priority)
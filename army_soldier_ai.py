@@ -1,9 +1,174 @@
 """
 Soldier AI - Formation following and squad coordination
 """
+import logging
 import math
+import numpy as np
+from game.blackboard import TEAM_TAGS
 from game.formation import CommandInfluence
 
+# Per-soldier trace output is debug-level; enable with logging.getLogger("game.army_soldier_ai").setLevel(logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# Enemies within these distances of a friendly general / officer count as threats to it
+GENERAL_THREAT_RADIUS = 200
+OFFICER_THREAT_RADIUS = 150
+
+# Target priority of an enemy by rank (general > officer > soldier)
+RANK_TARGET_SCORE = {
+    "soldier": 1.0,
+    "officer": 2.0,
+    "general": 3.0
+}
+
+# Without a unit index, teams with at least this many live units get ArmyArrays
+# and vectorized enemy scans; below it NumPy call overhead outweighs the per-enemy loop
+VECTORIZED_TARGETING_MIN_UNITS = 48
+
+
+def _seek(transform, dx, dy, distance, speed):
+    """Set velocity along (dx, dy) at speed (distance = hypot(dx, dy) > 0). Returns True"""
+    transform.vx = dx / distance * speed
+    transform.vy = dy / distance * speed
+    return True
+
+
+def _result_entity_id(result):
+    """Sort key for (entity, dist_sq) results of SoldierFrame.units_within"""
+    return result[0].id
+
+
+class ArmyArrays:
+    """
+    Contiguous position arrays for one team's live units, row-aligned with
+    SoldierFrame.live_by_team. Positions are snapshotted at frame start.
+    """
+    def __init__(self, entities):
+        count = len(entities)
+        self.xs = np.fromiter((e.transform.x for e in entities), dtype=np.float64, count=count)
+        self.ys = np.fromiter((e.transform.y for e in entities), dtype=np.float64, count=count)
+
+    def within(self, x, y, radius):
+        """Row indices and squared distances of units within radius of (x, y)"""
+        dx = self.xs - x
+        dy = self.ys - y
+        dist_sq = dx * dx + dy * dy
+        rows = np.flatnonzero(dist_sq < radius * radius)
+        return rows.tolist(), dist_sq[rows].tolist()
+
+
+class SoldierFrame:
+    """
+    Per-frame snapshot of the tag queries and squad lookups soldiers need.
+    Built once in SoldierAISystem.update and shared by every soldier,
+    instead of each soldier re-scanning the entity list.
+    """
+    def __init__(self, entity_manager, blackboard):
+        self.entity_manager = entity_manager
+        self.blackboard = blackboard
+        # team -> SpatialHash of live units (rebuilt each tick by blackboard.index_units)
+        self.unit_index = blackboard.team_unit_index
+        self.squad_officer_positions = {}  # squad_id -> (x, y) or None, filled on first use
+        self.commander_threats = {}        # commander key -> [(enemy, x, y)], filled on first use
+        self.officers_by_team = {}   # team -> active officers with a Transform
+        self.generals_by_team = {}   # team -> active generals with a Transform
+        self.commanders_by_team = {} # team -> (officer, "officer", x, y) for find_nearest_commander
+        self.live_by_team = {}       # team -> active, not dead, with a Transform
+        self.arrays_by_team = {}     # team -> ArmyArrays or None, built on first unindexed scan
+
+        for team, team_tag in enumerate(TEAM_TAGS):
+            officers = []
+            generals = []
+            live = []
+            for entity in entity_manager.get_entities_with_tag(team_tag):
+                if not entity.transform:
+                    continue
+                if entity.has_tag("officer"):
+                    officers.append(entity)
+                elif entity.has_tag("general"):
+                    generals.append(entity)
+                health = entity.health
+                if health and health.dead:
+                    continue
+                live.append(entity)
+            self.officers_by_team[team] = officers
+            self.commanders_by_team[team] = [
+                (officer, "officer", officer.transform.x, officer.transform.y) for officer in officers
+            ]
+            self.generals_by_team[team] = generals
+            self.live_by_team[team] = live
+
+    def squad_officer_position(self, squad_id):
+        """Position of the squad's active officer (None if gone), looked up once per squad per frame"""
+        positions = self.squad_officer_positions
+        if squad_id in positions:
+            return positions[squad_id]
+
+        position = None
+        squad_info = self.blackboard.get_squad_info(squad_id)
+        if squad_info:
+            officer_entity = self.entity_manager.get_entity(squad_info.get("officer_id"))
+            if officer_entity and officer_entity.active and officer_entity.transform:
+                position = (officer_entity.transform.x, officer_entity.transform.y)
+        positions[squad_id] = position
+        return position
+
+    def threats_near(self, key, team, x, y, radius):
+        """
+        Units of team within radius of a commander at (x, y), as (entity, x, y).
+        Shared by every soldier protecting that commander this frame (memoized per key)
+        """
+        threats = self.commander_threats.get(key)
+        if threats is None:
+            threats = [(entity, entity.transform.x, entity.transform.y)
+                       for entity, _ in self.units_within(team, x, y, radius)]
+            self.commander_threats[key] = threats
+        return threats
+
+    def team_arrays(self, team):
+        """ArmyArrays for a large team (None for small teams), built once per frame on first use"""
+        arrays_by_team = self.arrays_by_team
+        if team in arrays_by_team:
+            return arrays_by_team[team]
+        live = self.live_by_team.get(team, ())
+        arrays = ArmyArrays(live) if len(live) >= VECTORIZED_TARGETING_MIN_UNITS else None
+        arrays_by_team[team] = arrays
+        return arrays
+
+    def units_within(self, team, x, y, radius):
+        """
+        Live units of team strictly within radius of (x, y).
+        Returns a list of (entity, dist_sq) in a stable order (entity id for
+        indexed teams, team order otherwise), so callers that keep the first
+        of equal candidates pick the same one every run
+        """
+        index = self.unit_index.get(team)
+        if index is not None:
+            # Broad phase: only the grid cells overlapping the search square
+            candidates = index.query_rect(x - radius, y - radius, radius * 2, radius * 2)
+        else:
+            # Not indexed - scan the whole team
+            arrays = self.team_arrays(team)
+            if arrays:
+                live = self.live_by_team[team]
+                rows, dist_sqs = arrays.within(x, y, radius)
+                return [(live[row], dist_sq) for row, dist_sq in zip(rows, dist_sqs)]
+            candidates = self.live_by_team.get(team, ())
+
+        radius_sq = radius * radius
+        results = []
+        for entity in candidates:
+            entity_transform = entity.transform
+            dx = entity_transform.x - x
+            dy = entity_transform.y - y
+            dist_sq = dx*dx + dy*dy
+            if dist_sq < radius_sq:
+                results.append((entity, dist_sq))
+        if index is not None:
+            # query_rect comes back in set order; restore a stable one
+            results.sort(key=_result_entity_id)
+        return results
+
 
 class SoldierAI:
     """
@@ -23,63 +188,55 @@ class SoldierAI:
         self.combat_seek_strength = 0.3     # How strongly to seek enemies
         self.formation_tolerance = 30       # "Good enough" distance from ideal position
 
-    def update(self, dt, soldier_entity):
-        """Update soldier behavior"""
-        transform = soldier_entity.get_component("Transform")
-        unit = soldier_entity.get_component("Unit")
-        combat = soldier_entity.get_component("Combat")
-        health = soldier_entity.get_component("Health")
+        # Scratch list reused by select_priority_target
+        self._nearby_enemies = []
+
+    def update(self, dt, soldier_entity, frame):
+        """
+        Update soldier behavior (frame: this tick's SoldierFrame).
+        Only sets velocity; returns True if the soldier should be moved by it this tick
+        """
+        transform = soldier_entity.transform
+        unit = soldier_entity.unit
+        combat = soldier_entity.combat
+        health = soldier_entity.health
 
         if not transform or not unit or not combat or not health:
-            return
+            return False
 
         # Skip if dead
         if health.dead:
-            return
+            return False
 
         # Find commanding officer
-        officer = self.find_commanding_officer(soldier_entity)
+        officer = self.find_commanding_officer(soldier_entity, frame)
 
         if officer:
             # We have a commander - follow formation
-            self.follow_formation(soldier_entity, officer, transform, unit, combat, dt)
-        else:
-            # No commander nearby - default wander/defensive behavior
-            self.default_behavior(soldier_entity, transform, unit, combat, dt)
+            return self.follow_formation(soldier_entity, officer, transform, unit, combat, dt, frame)
+        # No commander nearby - default wander/defensive behavior
+        return self.default_behavior(soldier_entity, transform, unit, combat, dt, frame)
 
-    def find_commanding_officer(self, soldier_entity):
+    def find_commanding_officer(self, soldier_entity, frame):
         """Find nearest officer within command radius"""
-        transform = soldier_entity.get_component("Transform")
-        unit = soldier_entity.get_component("Unit")
+        transform = soldier_entity.transform
+        unit = soldier_entity.unit
 
         if not transform or not unit:
             return None
 
-        # Get all officers from same team
-        team_tag = f"team_{unit.team}"
-        officers = [e for e in self.entity_manager.get_entities_with_tag("officer")
-                   if e.active and e.has_tag(team_tag)]
-
-        # Build commander list
-        commanders = []
-        for officer in officers:
-            off_transform = officer.get_component("Transform")
-            if off_transform:
-                commanders.append((officer, "officer", off_transform.x, off_transform.y))
-
-        # Find nearest in radius
+        # Find nearest in radius among this frame's officers of the same team
         nearest, dist = CommandInfluence.find_nearest_commander(
-            transform.x, transform.y, "soldier", commanders
+            transform.x, transform.y, "soldier", frame.commanders_by_team.get(unit.team, ())
         )
 
         return nearest
 
-    def follow_formation(self, soldier_entity, officer, transform, unit, combat, dt):
+    def follow_formation(self, soldier_entity, officer, transform, unit, combat, dt, frame):
         """Follow officer's formation and engage enemies"""
         # Check if this soldier is a scout
         if self.blackboard.is_scout(soldier_entity.id):
-            self.scout_patrol_behavior(soldier_entity, transform, unit, combat, dt)
-            return
+            return self.scout_patrol_behavior(soldier_entity, transform, unit, combat, dt, frame)
 
         # Get squad assignment
         squad_id = unit.squad_id
@@ -91,38 +248,29 @@ class SoldierAI:
             # Calculate distance to formation position
             dx = target_x - transform.x
             dy = target_y - transform.y
-            distance_to_formation = math.sqrt(dx*dx + dy*dy)
+            distance_to_formation = math.hypot(dx, dy)
 
             # Update formation deviation (for cohesion tracking)
             unit.formation_deviation = distance_to_formation
 
             # Look for priority target (protection > high-rank enemies > nearest)
             nearest_enemy, nearest_enemy_dist = self.select_priority_target(
-                soldier_entity, transform, unit, combat
+                soldier_entity, transform, unit, combat, frame
             )
 
             # Decision: Formation vs Combat
             if nearest_enemy and nearest_enemy_dist < combat.attack_range * 2:
                 # Enemy very close - engage
-                self.engage_enemy(transform, nearest_enemy, combat, dt)
+                return self.engage_enemy(transform, nearest_enemy, combat, dt)
 
             elif distance_to_formation > self.formation_tolerance:
-                # Not in position - move to formation
-                if distance_to_formation > 0:
-                    # Move toward formation position
-                    move_speed = 120 * unit.get_combat_modifier()  # Morale affects movement
-                    direction_x = dx / distance_to_formation
-                    direction_y = dy / distance_to_formation
-                    transform.vx = direction_x * move_speed
-                    transform.vy = direction_y * move_speed
-
-                    # Update position
-                    transform.x += transform.vx * dt
-                    transform.y += transform.vy * dt
+                # Not in position - move toward formation position
+                move_speed = 120 * unit.get_combat_modifier()  # Morale affects movement
+                return _seek(transform, dx, dy, distance_to_formation, move_speed)
 
             elif nearest_enemy and nearest_enemy_dist < combat.attack_range * 3:
                 # In formation, enemy in range - engage while maintaining position
-                self.engage_enemy(transform, nearest_enemy, combat, dt)
+                return self.engage_enemy(transform, nearest_enemy, combat, dt)
 
             else:
                 # In formation, no immediate threats - hold position
@@ -131,27 +279,19 @@ class SoldierAI:
 
         else:
             # No formation position assigned - move toward officer
-            officer_transform = officer.get_component("Transform")
+            officer_transform = officer.transform
             if officer_transform:
                 dx = officer_transform.x - transform.x
                 dy = officer_transform.y - transform.y
-                distance = math.sqrt(dx*dx + dy*dy)
-
-                if distance > 100:  # Not too close to officer
-                    move_speed = 100
-                    if distance > 0:
-                        direction_x = dx / distance
-                        direction_y = dy / distance
-                        transform.vx = direction_x * move_speed
-                        transform.vy = direction_y * move_speed
-
-                        transform.x += transform.vx * dt
-                        transform.y += transform.vy * dt
+
+                if dx*dx + dy*dy > 100 * 100:  # Not too close to officer
+                    return _seek(transform, dx, dy, math.hypot(dx, dy), 100)
                 else:
                     transform.vx = 0
                     transform.vy = 0
+        return False
 
-    def select_priority_target(self, soldier_entity, transform, unit, combat):
+    def select_priority_target(self, soldier_entity, transform, unit, combat, frame):
         """
         Select target based on priorities:
         1. Protect friendly commanders under threat (general > officer > self)
@@ -162,273 +302,199 @@ class SoldierAI:
         """
         enemy_team = 1 - unit.team
         friendly_team = unit.team
-        enemy_tag = f"team_{enemy_team}"
-        friendly_tag = f"team_{friendly_team}"
 
         detection_range = combat.attack_range * 4  # Can detect enemies up to 4x attack range
-
-        # Get all nearby enemies
-        nearby_enemies = []
-        for enemy in self.entity_manager.get_entities_with_tag(enemy_tag):
-            if not enemy.active:
-                continue
-
-            enemy_health = enemy.get_component("Health")
-            if enemy_health and enemy_health.dead:
-                continue
-
-            enemy_transform = enemy.get_component("Transform")
-            if not enemy_transform:
-                continue
-
-            dx = enemy_transform.x - transform.x
-            dy = enemy_transform.y - transform.y
-            dist = math.sqrt(dx*dx + dy*dy)
-
-            if dist < detection_range:
-                enemy_unit = enemy.get_component("Unit")
-                rank = enemy_unit.rank if enemy_unit else "soldier"
-                nearby_enemies.append((enemy, dist, rank, enemy_transform))
-
-        if not nearby_enemies:
-            return None, float('inf')
+        detection_range_sq = detection_range * detection_range
+        tx = transform.x
+        ty = transform.y
 
         # PRIORITY 1: Protect friendly commanders under threat
+        # Threats are found around the (few) commanders first, so the full
+        # candidate list below is only built when nobody needs protecting
         # Check if our general is threatened
-        generals = [e for e in self.entity_manager.get_entities_with_tag("general")
-                   if e.active and e.has_tag(friendly_tag)]
-
-        for general in generals:
-            general_transform = general.get_component("Transform")
-            if not general_transform:
-                continue
-
-            # Find enemies threatening our general
-            for enemy, enemy_dist, enemy_rank, enemy_transform in nearby_enemies:
-                dx = enemy_transform.x - general_transform.x
-                dy = enemy_transform.y - general_transform.y
-                threat_dist = math.sqrt(dx*dx + dy*dy)
-
-                # Enemy within 200 pixels of our general = threat!
-                if threat_dist < 200:
-                    # Calculate distance from soldier to this threatening enemy
-                    dx_soldier = enemy_transform.x - transform.x
-                    dy_soldier = enemy_transform.y - transform.y
-                    soldier_to_threat = math.sqrt(dx_soldier*dx_soldier + dy_soldier*dy_soldier)
-
-                    print(f"[PROTECTION] Soldier protecting general from {enemy_rank}!")
-                    return enemy, soldier_to_threat
+        for general in frame.generals_by_team.get(friendly_team, ()):
+            general_transform = general.transform
+            threats = frame.threats_near(("general", general.id), enemy_team,
+                                         general_transform.x, general_transform.y, GENERAL_THREAT_RADIUS)
+
+            # Threatening enemy within our detection range
+            for enemy, ex, ey in threats:
+                dx = ex - tx
+                dy = ey - ty
+                dist_sq = dx*dx + dy*dy
+                if dist_sq < detection_range_sq:
+                    logger.debug("[PROTECTION] Soldier protecting general from %s!",
+                                 enemy.unit.rank if enemy.unit else "soldier")
+                    return enemy, math.sqrt(dist_sq)
 
         # Check if our officer is threatened (only check our squad's officer)
-        squad_id = unit.squad_id if hasattr(unit, 'squad_id') else None
-        if squad_id:
-            squad_info = self.blackboard.get_squad_info(squad_id)
-            if squad_info:
-                officer_id = squad_info.get("officer_id")
-
-                # Find our officer entity
-                for entity in self.entity_manager.entities:
-                    if entity.id == officer_id and entity.active:
-                        officer_transform = entity.get_component("Transform")
-                        if not officer_transform:
-                            continue
-
-                        # Find enemies threatening our officer
-                        for enemy, enemy_dist, enemy_rank, enemy_transform in nearby_enemies:
-                            dx = enemy_transform.x - officer_transform.x
-                            dy = enemy_transform.y - officer_transform.y
-                            threat_dist = math.sqrt(dx*dx + dy*dy)
-
-                            # Enemy within 150 pixels of our officer = threat!
-                            if threat_dist < 150:
-                                dx_soldier = enemy_transform.x - transform.x
-                                dy_soldier = enemy_transform.y - transform.y
-                                soldier_to_threat = math.sqrt(dx_soldier*dx_soldier + dy_soldier*dy_soldier)
-
-                                print(f"[PROTECTION] Soldier protecting officer from {enemy_rank}!")
-                                return enemy, soldier_to_threat
-
-        # PRIORITY 2: Target high-rank enemies
-        # Rank priority scores: general=3, officer=2, soldier=1
-        rank_scores = {"general": 3.0, "officer": 2.0, "soldier": 1.0}
-
-        def target_score(enemy_tuple):
-            enemy, dist, rank, _ = enemy_tuple
-            rank_score = rank_scores.get(rank, 1.0)
-            # Score = rank_value / (distance/100 + 0.5)
-            # Prioritizes high rank, but distance still matters
-            distance_factor = (dist / 100.0) + 0.5
-            return rank_score / distance_factor
+        squad_id = unit.squad_id
+        officer_position = frame.squad_officer_position(squad_id) if squad_id else None
+        if officer_position:
+            ox, oy = officer_position
+            threats = frame.threats_near(("squad", squad_id), enemy_team, ox, oy, OFFICER_THREAT_RADIUS)
+
+            # Threatening enemy within our detection range
+            for enemy, ex, ey in threats:
+                dx = ex - tx
+                dy = ey - ty
+                dist_sq = dx*dx + dy*dy
+                if dist_sq < detection_range_sq:
+                    logger.debug("[PROTECTION] Soldier protecting officer from %s!",
+                                 enemy.unit.rank if enemy.unit else "soldier")
+                    return enemy, math.sqrt(dist_sq)
+
+        # Get all nearby enemies as (enemy, dist_sq, rank)
+        nearby_enemies = self._nearby_enemies
+        nearby_enemies.clear()
+        for enemy, dist_sq in frame.units_within(enemy_team, tx, ty, detection_range):
+            enemy_unit = enemy.unit
+            rank = enemy_unit.rank if enemy_unit else "soldier"
+            nearby_enemies.append((enemy, dist_sq, rank))
 
-        # Sort by score (highest first)
-        nearby_enemies.sort(key=target_score, reverse=True)
+        if not nearby_enemies:
+            return None, float('inf')
 
-        best_enemy, best_dist, best_rank, _ = nearby_enemies[0]
-        return best_enemy, best_dist
+        # PRIORITY 2: Target high-rank enemies
+        # Score = RANK_TARGET_SCORE / (distance/100 + 0.5)
+        # Prioritizes high rank, but distance still matters
+        # Single pass for the highest score (first one wins ties)
+        best_enemy = None
+        best_dist_sq = 0.0
+        best_score = -1.0
+        for enemy, dist_sq, rank in nearby_enemies:
+            score = RANK_TARGET_SCORE.get(rank, 1.0) / ((math.sqrt(dist_sq) / 100.0) + 0.5)
+            if score > best_score:
+                best_enemy = enemy
+                best_dist_sq = dist_sq
+                best_score = score
+
+        return best_enemy, math.sqrt(best_dist_sq)
 
     def engage_enemy(self, transform, enemy, combat, dt):
-        """Engage enemy in combat"""
-        enemy_transform = enemy.get_component("Transform")
+        """Engage enemy in combat (returns True if closing in)"""
+        enemy_transform = enemy.transform
         if not enemy_transform:
-            return
+            return False
 
         dx = enemy_transform.x - transform.x
         dy = enemy_transform.y - transform.y
-        distance = math.sqrt(dx*dx + dy*dy)
+        attack_range = combat.attack_range
 
-        if distance > combat.attack_range:
+        if dx*dx + dy*dy > attack_range * attack_range:
             # Move closer
+            distance = math.hypot(dx, dy)
             if distance > 0:
-                direction_x = dx / distance
-                direction_y = dy / distance
-                transform.vx = direction_x * 100
-                transform.vy = direction_y * 100
-
-                transform.x += transform.vx * dt
-                transform.y += transform.vy * dt
+                return _seek(transform, dx, dy, distance, 100)
         else:
             # In range - stop and attack (attack handled by combat system)
             transform.vx = 0
             transform.vy = 0
+        return False
 
-    def default_behavior(self, soldier_entity, transform, unit, combat, dt):
+    def default_behavior(self, soldier_entity, transform, unit, combat, dt, frame):
         """Default behavior when no officer commanding"""
         # Priority 1: Try to find ANY friendly officer or general to rally to
-        team_tag = f"team_{unit.team}"
-
         # Look for officers first
-        officers = [e for e in self.entity_manager.get_entities_with_tag("officer")
-                   if e.active and e.has_tag(team_tag)]
+        officers = frame.officers_by_team.get(unit.team)
 
         # If no officers, look for general
         if not officers:
-            officers = [e for e in self.entity_manager.get_entities_with_tag("general")
-                       if e.active and e.has_tag(team_tag)]
+            officers = frame.generals_by_team.get(unit.team)
 
         # Rally to nearest commander
         if officers:
             nearest_officer = None
-            nearest_officer_dist = float('inf')
+            nearest_officer_dist_sq = float('inf')
 
             for officer in officers:
-                off_transform = officer.get_component("Transform")
-                if off_transform:
-                    dx = off_transform.x - transform.x
-                    dy = off_transform.y - transform.y
-                    dist = math.sqrt(dx*dx + dy*dy)
+                off_transform = officer.transform
+                dx = off_transform.x - transform.x
+                dy = off_transform.y - transform.y
+                dist_sq = dx*dx + dy*dy
 
-                    if dist < nearest_officer_dist:
-                        nearest_officer = off_transform
-                        nearest_officer_dist = dist
+                if dist_sq < nearest_officer_dist_sq:
+                    nearest_officer = off_transform
+                    nearest_officer_dist_sq = dist_sq
 
             # Move toward commander if found
-            if nearest_officer and nearest_officer_dist > 50:
+            if nearest_officer and nearest_officer_dist_sq > 50 * 50:
                 rally_speed = 100
                 dx = nearest_officer.x - transform.x
                 dy = nearest_officer.y - transform.y
-                dist = math.sqrt(dx*dx + dy*dy)
-
-                if dist > 0:
-                    direction_x = dx / dist
-                    direction_y = dy / dist
-                    transform.vx = direction_x * rally_speed
-                    transform.vy = direction_y * rally_speed
-                    transform.x += transform.vx * dt
-                    transform.y += transform.vy * dt
-                print(f"[SOLDIER RALLY] Soldier moving to rally with commander at distance {int(nearest_officer_dist)}")
-                return
+                dist = math.hypot(dx, dy)
+                logger.debug("[SOLDIER RALLY] Soldier moving to rally with commander at distance %d", dist)
+                return _seek(transform, dx, dy, dist, rally_speed)
 
         # Priority 2: Look for priority target to engage (with protection/rank priorities)
         nearest_enemy, nearest_dist = self.select_priority_target(
-            soldier_entity, transform, unit, combat
+            soldier_entity, transform, unit, combat, frame
         )
 
         if nearest_enemy and nearest_dist < 400:
             # Enemy nearby - engage
-            self.engage_enemy(transform, nearest_enemy, combat, dt)
-        else:
-            # Priority 3: No commanders or enemies - defensive idle
-            transform.vx = 0
-            transform.vy = 0
+            return self.engage_enemy(transform, nearest_enemy, combat, dt)
+
+        # Priority 3: No commanders or enemies - defensive idle
+        transform.vx = 0
+        transform.vy = 0
+        return False
 
-    def scout_patrol_behavior(self, soldier_entity, transform, unit, combat, dt):
+    def scout_patrol_behavior(self, soldier_entity, transform, unit, combat, dt, frame):
         """Scout patrols assigned position and reports enemy sightings"""
         # Get scout patrol position from blackboard
         patrol_pos = self.blackboard.get_scout_patrol_position(soldier_entity.id)
 
         if not patrol_pos:
             # No patrol position assigned - shouldn't happen, but default to rally behavior
-            print(f"[SCOUT {soldier_entity.id}] WARNING: No patrol position assigned!")
-            return
+            logger.debug("[SCOUT %s] WARNING: No patrol position assigned!", soldier_entity.id)
+            return False
 
         patrol_x, patrol_y = patrol_pos
 
         # Calculate distance to patrol position
         dx = patrol_x - transform.x
         dy = patrol_y - transform.y
-        distance_to_patrol = math.sqrt(dx*dx + dy*dy)
+        distance_to_patrol = math.hypot(dx, dy)
 
         # Look for nearby enemies to report
         enemy_team = 1 - unit.team
-        enemy_tag = f"team_{enemy_team}"
-        enemies = [e for e in self.entity_manager.get_entities_with_tag(enemy_tag)
-                  if e.active]
 
         detection_range = 300  # Scouts can see enemies from 300 pixels away
+        retreat_range_sq = (combat.attack_range * 2) ** 2
+
+        for enemy, enemy_dist_sq in frame.units_within(enemy_team, transform.x, transform.y, detection_range):
+            enemy_transform = enemy.transform
+            enemy_unit = enemy.unit
+
+            enemy_type = enemy_unit.rank if enemy_unit else "unknown"
+            # Report enemy within detection range to blackboard (logged at debug level)
+            self.blackboard.report_scout_sighting(
+                soldier_entity.id,
+                (enemy_transform.x, enemy_transform.y),
+                0,  # game_time (will be updated by system)
+                enemy_type
+            )
 
-        for enemy in enemies:
-            enemy_health = enemy.get_component("Health")
-            if enemy_health and enemy_health.dead:
-                continue
-
-            enemy_transform = enemy.get_component("Transform")
-            enemy_unit = enemy.get_component("Unit")
-
-            if enemy_transform:
-                ex = enemy_transform.x - transform.x
-                ey = enemy_transform.y - transform.y
-                enemy_dist = math.sqrt(ex*ex + ey*ey)
-
-                # Report enemy if within detection range
-                if enemy_dist < detection_range:
-                    enemy_type = enemy_unit.rank if enemy_unit else "unknown"
-                    # Report to blackboard (will print to console)
-                    self.blackboard.report_scout_sighting(
-                        soldier_entity.id,
-                        (enemy_transform.x, enemy_transform.y),
-                        0,  # game_time (will be updated by system)
-                        enemy_type
-                    )
-
-                    # Scouts don't engage - they avoid combat
-                    if enemy_dist < combat.attack_range * 2:
-                        # Enemy too close - retreat toward patrol position
-                        if distance_to_patrol > 0:
-                            retreat_speed = 140  # Scouts move faster when retreating
-                            direction_x = dx / distance_to_patrol
-                            direction_y = dy / distance_to_patrol
-                            transform.vx = direction_x * retreat_speed
-                            transform.vy = direction_y * retreat_speed
-                            transform.x += transform.vx * dt
-                            transform.y += transform.vy * dt
-                        return
+            # Scouts don't engage - they avoid combat
+            if enemy_dist_sq < retreat_range_sq:
+                # Enemy too close - retreat toward patrol position
+                if distance_to_patrol > 0:
+                    retreat_speed = 140  # Scouts move faster when retreating
+                    return _seek(transform, dx, dy, distance_to_patrol, retreat_speed)
+                return False
 
         # No immediate threats - patrol normally
         if distance_to_patrol > 20:
             # Move to patrol position
             patrol_speed = 100
-            if distance_to_patrol > 0:
-                direction_x = dx / distance_to_patrol
-                direction_y = dy / distance_to_patrol
-                transform.vx = direction_x * patrol_speed
-                transform.vy = direction_y * patrol_speed
-                transform.x += transform.vx * dt
-                transform.y += transform.vy * dt
+            return _seek(transform, dx, dy, distance_to_patrol, patrol_speed)
         else:
             # At patrol position - small circular patrol
             # Simple idle behavior - could be enhanced with actual patrol pattern
             transform.vx = 0
             transform.vy = 0
+        return False
 
 
 class SoldierAISystem:
@@ -442,7 +508,18 @@ class SoldierAISystem:
     def update(self, dt):
         """Update all soldiers"""
         soldiers = self.entity_manager.get_entities_with_tag("soldier")
+        if not soldiers:
+            return
+
+        # Tag queries shared by every soldier this frame
+        frame = SoldierFrame(self.entity_manager, self.blackboard)
 
+        # Decide velocities against start-of-frame positions, then integrate in one pass
+        moving = []
         for soldier in soldiers:
-            if soldier.active:
-                self.soldier_ai.update(dt, soldier)
+            if soldier.active and self.soldier_ai.update(dt, soldier, frame):
+                moving.append(soldier.transform)
+
+        for transform in moving:
+            transform.x += transform.vx * dt
+            transform.y += transform.vy * dt
@@ -26,6 +26,8 @@ class ArmyManager:
         # AI controllers
         self.general_ai_team0 = GeneralAI(0, self.blackboard, self.formation_manager)
         self.general_ai_team1 = GeneralAI(1, self.blackboard, self.formation_manager)
+        # Run the two generals' strategic decisions half a cycle apart
+        self.general_ai_team1.decision_timer = self.general_ai_team1.decision_cooldown / 2
 
         self.officer_ais = {}  # officer_id -> OfficerAI instance
         self.soldier_ai_system = SoldierAISystem(entity_manager, self.blackboard, self.formation_manager)
@@ -36,6 +38,9 @@ class ArmyManager:
         # Game time (for command delays)
         self.game_time = 0.0
 
+        # draw_debug aura surfaces, (radius, team) -> pygame.Surface
+        self._aura_cache = {}
+
     def initialize_armies(self, world_width, world_height):
         """Deploy initial armies"""
         if not self.armies_deployed:
@@ -59,6 +64,9 @@ class ArmyManager:
         # Update reinforcements
         self.deployment.update(dt)
 
+        # Index unit positions for this tick's threat queries
+        self.blackboard.index_units(self.entity_manager)
+
         # Update General AI (strategic layer)
         self._update_generals(dt)
 
@@ -80,11 +88,11 @@ class ArmyManager:
         general_team0 = None
         general_team1 = None
 
-        for entity in self.entity_manager.get_entities_with_tag("general"):
+        for entity in self.entity_manager.get_tag_bucket("general"):
             if not entity.active:
                 continue
 
-            unit = entity.get_component("Unit")
+            unit = entity.unit
             if unit:
                 if unit.team == 0:
                     general_team0 = entity
@@ -101,48 +109,63 @@ class ArmyManager:
 
     def _update_officers(self, dt):
         """Update all officers"""
-        officers = self.entity_manager.get_entities_with_tag("officer")
+        officers = self.entity_manager.get_tag_bucket("officer")
+        moving = []   # Transforms of officers that set a velocity this tick
+        squads = []   # (officer_ai, officer) pairs updated this tick
 
         for officer in officers:
             if not officer.active:
                 continue
 
-            unit = officer.get_component("Unit")
+            unit = officer.unit
             if not unit or not unit.squad_id:
                 continue
 
             # Get or create OfficerAI for this officer
             if officer.id not in self.officer_ais:
-                self.officer_ais[officer.id] = OfficerAI(
+                officer_ai = OfficerAI(
                     unit.squad_id, self.blackboard, self.formation_manager, self.entity_manager
                 )
+                # Spread decision ticks so evaluations don't spike on one frame
+                officer_ai.stagger_decisions(len(self.officer_ais))
+                self.officer_ais[officer.id] = officer_ai
 
             officer_ai = self.officer_ais[officer.id]
-            officer_ai.update(dt, self.entity_manager, officer, self.game_time, self.objective_system)
+            if officer_ai.update(dt, self.entity_manager, officer, self.game_time, self.objective_system):
+                moving.append(officer.transform)
+            squads.append((officer_ai, officer))
+
+        # Integrate officer movement in one pass
+        for transform in moving:
+            transform.x += transform.vx * dt
+            transform.y += transform.vy * dt
+
+        # Lay out squad formations around the officers' new positions
+        for officer_ai, officer in squads:
+            officer_ai.update_squad_formation(self.entity_manager, officer)
 
     def _update_squad_cohesion(self):
         """Calculate cohesion for all squads"""
+        squad_positions = {}
         for squad_id, squad_data in self.blackboard.squad_assignments.items():
             soldier_ids = squad_data["soldier_ids"]
 
             # Get actual positions of soldiers
             soldier_positions = []
             for soldier_id in soldier_ids:
-                soldier = None
-                for e in self.entity_manager.entities:
-                    if e.id == soldier_id and e.active:
-                        soldier = e
-                        break
-
-                if soldier:
-                    transform = soldier.get_component("Transform")
+                soldier = self.entity_manager.get_entity(soldier_id)
+                if soldier and soldier.active:
+                    transform = soldier.transform
                     if transform:
                         soldier_positions.append((transform.x, transform.y))
 
-            # Update cohesion
             if soldier_positions:
-                cohesion = self.formation_manager.update_cohesion(squad_id, soldier_positions)
-                self.blackboard.update_cohesion(squad_id, cohesion)
+                squad_positions[squad_id] = soldier_positions
+
+        # Update cohesion for every squad in one batch
+        cohesions = self.formation_manager.update_cohesion_batch(squad_positions)
+        for squad_id, cohesion in cohesions.items():
+            self.blackboard.update_cohesion(squad_id, cohesion)
 
     def _update_morale(self, dt):
         """Update team morale based on battlefield conditions"""
@@ -166,12 +189,8 @@ class ArmyManager:
                 morale_delta -= 0.005 * dt
 
             # Owning bases increases morale
-            if team_id == 0:
-                our_bases = len(self.objective_system.get_player_bases())
-                enemy_bases = len(self.objective_system.get_enemy_bases())
-            else:
-                our_bases = len(self.objective_system.get_enemy_bases())
-                enemy_bases = len(self.objective_system.get_player_bases())
+            our_bases = len(self.objective_system.get_team_bases(team_id))
+            enemy_bases = len(self.objective_system.get_team_bases(enemy_team))
 
             if our_bases > enemy_bases:
                 morale_delta += 0.01 * dt
@@ -192,30 +211,28 @@ class ArmyManager:
         import pygame
         from game.formation import CommandInfluence
 
-        # Draw command influence radii
-        for entity in self.entity_manager.entities:
-            if not entity.active:
-                continue
+        # Draw command influence radii (the commander's tag is its rank)
+        for tag in ("officer", "general"):
+            radius = CommandInfluence.INFLUENCE_RADIUS.get(tag, 300)
 
-            if entity.has_tag("officer") or entity.has_tag("general"):
-                transform = entity.get_component("Transform")
-                unit = entity.get_component("Unit")
+            for entity in self.entity_manager.get_tag_bucket(tag):
+                if not entity.active:
+                    continue
+                transform = entity.transform
+                unit = entity.unit
 
                 if transform and unit:
-                    screen_x = int(transform.x - camera_x)
-                    screen_y = int(transform.y - camera_y)
-
-                    # Get radius
-                    radius = CommandInfluence.INFLUENCE_RADIUS.get(unit.rank, 300)
-
-                    # Draw subtle aura
-                    color = (100, 150, 255, 30) if unit.team == 0 else (255, 100, 100, 30)
-
-                    # Create transparent surface for aura
-                    aura_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(aura_surface, color, (radius, radius), radius, 2)
-
-                    screen.blit(aura_surface, (screen_x - radius, screen_y - radius))
+                    # Draw subtle aura (transparent surface built once per radius/team)
+                    key = (radius, unit.team)
+                    aura_surface = self._aura_cache.get(key)
+                    if aura_surface is None:
+                        color = (100, 150, 255, 30) if unit.team == 0 else (255, 100, 100, 30)
+                        aura_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                        pygame.draw.circle(aura_surface, color, (radius, radius), radius, 2)
+                        self._aura_cache[key] = aura_surface
+
+                    screen.blit(aura_surface, (int(transform.x - camera_x) - radius,
+                                               int(transform.y - camera_y) - radius))
 
         # Draw formation positions (debug lines)
         for squad_id in self.formation_manager.formations.keys():
@@ -7,6 +7,10 @@ import pygame
 import math
 from core.entity import Entity
 from core.component import Transform, Sprite, Health, Combat, AI
+from game.blackboard import RANK_COMBAT_POWER, TEAM_TAGS
+
+# Unit sprite surfaces, (rank, team) -> pygame.Surface shared by every unit of that kind
+_SPRITE_CACHE = {}
 
 
 class UnitRank:
@@ -21,8 +25,12 @@ class UnitComponent:
     Component to track unit rank and command relationships.
     Supports player rank progression.
     """
+    __slots__ = ("entity", "rank", "combat_power", "team", "squad_id", "commander_id", "subordinates",
+                 "morale", "experience", "formation_position", "formation_deviation")
+
     def __init__(self, rank=UnitRank.SOLDIER, team=0):
         self.rank = rank
+        self.combat_power = RANK_COMBAT_POWER.get(rank, 1.0)  # Weight in local superiority
         self.team = team
         self.squad_id = None  # Assigned squad
         self.commander_id = None  # ID of commanding officer/general
@@ -41,6 +49,7 @@ class UnitComponent:
         if new_rank in [UnitRank.SOLDIER, UnitRank.OFFICER, UnitRank.GENERAL]:
             old_rank = self.rank
             self.rank = new_rank
+            self.combat_power = RANK_COMBAT_POWER.get(new_rank, 1.0)
             return old_rank
         return None
 
@@ -57,21 +66,98 @@ class UnitComponent:
         return 0.5 + (self.morale * 0.5)  # 0.5x to 1.0x damage multiplier
 
 
+def _unit_surface(rank, team):
+    """Get the shared sprite surface for (rank, team), drawing it on first use"""
+    key = (rank, team)
+    surface = _SPRITE_CACHE.get(key)
+    if surface is None:
+        surface = _SURFACE_DRAWERS[rank](team)
+        # Match the display pixel format so blits take the fast path
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        _SPRITE_CACHE[key] = surface
+    return surface
+
+
 def create_soldier(entity_manager, x, y, team=0):
     """Create a soldier unit"""
+    return _build_soldier(entity_manager, x, y, team, _unit_surface(UnitRank.SOLDIER, team))
+
+
+def create_soldiers_batch(entity_manager, xs, ys, team=0):
+    """
+    Create one soldier per (xs[i], ys[i]) position.
+    Returns the list of created entities.
+    """
+    surface = _unit_surface(UnitRank.SOLDIER, team)
+    return [_build_soldier(entity_manager, x, y, team, surface) for x, y in zip(xs, ys)]
+
+
+def _draw_soldier_surface(team):
+    """Draw the soldier sprite (small, team-colored)"""
+    surface = pygame.Surface((32, 32), pygame.SRCALPHA)
+    color = (100, 150, 255) if team == 0 else (255, 100, 100)  # Blue for player, Red for enemy
+    pygame.draw.circle(surface, color, (16, 16), 14)
+    pygame.draw.circle(surface, (0, 0, 0), (16, 16), 14, 2)
+    return surface
+
+
+def _draw_officer_surface(team):
+    """Draw the officer sprite (medium, team-colored with gold/silver trim)"""
+    surface = pygame.Surface((48, 48), pygame.SRCALPHA)
+    color = (80, 120, 255) if team == 0 else (255, 80, 80)
+    trim_color = (255, 215, 0) if team == 0 else (192, 192, 192)  # Gold for player, Silver for enemy
+
+    # Main body
+    pygame.draw.circle(surface, color, (24, 24), 20)
+    pygame.draw.circle(surface, (0, 0, 0), (24, 24), 20, 3)
+
+    # Trim ring
+    pygame.draw.circle(surface, trim_color, (24, 24), 16, 3)
+
+    # Command insignia (chevrons)
+    pygame.draw.polygon(surface, trim_color, [(24, 10), (18, 18), (30, 18)])
+    return surface
+
+
+def _draw_general_surface(team):
+    """Draw the general sprite (large, team-colored with crown)"""
+    surface = pygame.Surface((64, 64), pygame.SRCALPHA)
+    color = (60, 100, 255) if team == 0 else (255, 60, 60)
+    crown_color = (255, 215, 0)  # Gold crown for both
+
+    # Main body
+    pygame.draw.circle(surface, color, (32, 32), 28)
+    pygame.draw.circle(surface, (0, 0, 0), (32, 32), 28, 4)
+
+    # Crown
+    crown_points = [(20, 14), (26, 8), (32, 4), (38, 8), (44, 14), (40, 20), (32, 18), (24, 20)]
+    pygame.draw.polygon(surface, crown_color, crown_points)
+    pygame.draw.polygon(surface, (0, 0, 0), crown_points, 2)
+
+    # Command star
+    pygame.draw.polygon(surface, (255, 255, 255),
+                       [(32, 28), (34, 34), (40, 34), (35, 38), (37, 44), (32, 40), (27, 44), (29, 38), (24, 34), (30, 34)])
+    return surface
+
+
+_SURFACE_DRAWERS = {
+    UnitRank.SOLDIER: _draw_soldier_surface,
+    UnitRank.OFFICER: _draw_officer_surface,
+    UnitRank.GENERAL: _draw_general_surface,
+}
+
+
+def _build_soldier(entity_manager, x, y, team, surface):
+    """Create a soldier entity using an already drawn sprite surface"""
     entity = entity_manager.create_entity()
-    entity.add_tag(f"team_{team}")
+    entity.add_tag(TEAM_TAGS[team])
     entity.add_tag("soldier")
     entity.add_tag("unit")
 
     transform = Transform(x, y)
     entity.add_component("Transform", transform)
 
-    # Soldier sprite (small, team-colored)
-    surface = pygame.Surface((32, 32), pygame.SRCALPHA)
-    color = (100, 150, 255) if team == 0 else (255, 100, 100)  # Blue for player, Red for enemy
-    pygame.draw.circle(surface, color, (16, 16), 14)
-    pygame.draw.circle(surface, (0, 0, 0), (16, 16), 14, 2)
     sprite = Sprite(surface, 32, 32)
     sprite.layer = 5
     entity.add_component("Sprite", sprite)
@@ -97,29 +183,14 @@ def create_soldier(entity_manager, x, y, team=0):
 def create_officer(entity_manager, x, y, team=0):
     """Create an officer unit"""
     entity = entity_manager.create_entity()
-    entity.add_tag(f"team_{team}")
+    entity.add_tag(TEAM_TAGS[team])
     entity.add_tag("officer")
     entity.add_tag("unit")
 
     transform = Transform(x, y)
     entity.add_component("Transform", transform)
 
-    # Officer sprite (medium, team-colored with gold/silver trim)
-    surface = pygame.Surface((48, 48), pygame.SRCALPHA)
-    color = (80, 120, 255) if team == 0 else (255, 80, 80)
-    trim_color = (255, 215, 0) if team == 0 else (192, 192, 192)  # Gold for player, Silver for enemy
-
-    # Main body
-    pygame.draw.circle(surface, color, (24, 24), 20)
-    pygame.draw.circle(surface, (0, 0, 0), (24, 24), 20, 3)
-
-    # Trim ring
-    pygame.draw.circle(surface, trim_color, (24, 24), 16, 3)
-
-    # Command insignia (chevrons)
-    pygame.draw.polygon(surface, trim_color, [(24, 10), (18, 18), (30, 18)])
-
-    sprite = Sprite(surface, 48, 48)
+    sprite = Sprite(_unit_surface(UnitRank.OFFICER, team), 48, 48)
     sprite.layer = 6  # Above soldiers
     entity.add_component("Sprite", sprite)
 
@@ -144,32 +215,14 @@ def create_officer(entity_manager, x, y, team=0):
 def create_general(entity_manager, x, y, team=0):
     """Create a general unit"""
     entity = entity_manager.create_entity()
-    entity.add_tag(f"team_{team}")
+    entity.add_tag(TEAM_TAGS[team])
     entity.add_tag("general")
     entity.add_tag("unit")
 
     transform = Transform(x, y)
     entity.add_component("Transform", transform)
 
-    # General sprite (large, team-colored with crown)
-    surface = pygame.Surface((64, 64), pygame.SRCALPHA)
-    color = (60, 100, 255) if team == 0 else (255, 60, 60)
-    crown_color = (255, 215, 0)  # Gold crown for both
-
-    # Main body
-    pygame.draw.circle(surface, color, (32, 32), 28)
-    pygame.draw.circle(surface, (0, 0, 0), (32, 32), 28, 4)
-
-    # Crown
-    crown_points = [(20, 14), (26, 8), (32, 4), (38, 8), (44, 14), (40, 20), (32, 18), (24, 20)]
-    pygame.draw.polygon(surface, crown_color, crown_points)
-    pygame.draw.polygon(surface, (0, 0, 0), crown_points, 2)
-
-    # Command star
-    pygame.draw.polygon(surface, (255, 255, 255),
-                       [(32, 28), (34, 34), (40, 34), (35, 38), (37, 44), (32, 40), (27, 44), (29, 38), (24, 34), (30, 34)])
-
-    sprite = Sprite(surface, 64, 64)
+    sprite = Sprite(_unit_surface(UnitRank.GENERAL, team), 64, 64)
     sprite.layer = 7  # Above officers
     entity.add_component("Sprite", sprite)
 
@@ -245,18 +298,19 @@ class GeneralData:
     Additional data for generals managing armies.
     Handles reserves and strategic decision making.
     """
+    # Reserve commit trigger bits
+    BASE_LOST = 1
+    NUMERICAL_INFERIORITY = 2
+    CRITICAL_OBJECTIVE = 4
+
     def __init__(self, team_id):
         self.team_id = team_id
         self.reserve_squads = []  # List of squad_ids held in reserve
         self.active_squads = []  # List of squad_ids in combat
         self.reserve_threshold = 0.3  # Keep 30% of force in reserve
 
-        # Strategic triggers
-        self.commit_reserves_triggers = {
-            "base_lost": False,
-            "numerical_inferiority": False,
-            "critical_objective": False
-        }
+        # Strategic triggers (bitfield of the trigger bits above)
+        self.commit_reserves_triggers = 0
 
     def allocate_reserves(self, total_squads):
         """Determine how many squads to keep in reserve"""
@@ -271,10 +325,10 @@ class GeneralData:
 
         # Numerical inferiority
         if team_stats["total_units"] < enemy_stats["total_units"] * 0.8:
-            self.commit_reserves_triggers["numerical_inferiority"] = True
+            self.commit_reserves_triggers |= self.NUMERICAL_INFERIORITY
 
         # Any trigger active?
-        return any(self.commit_reserves_triggers.values())
+        return self.commit_reserves_triggers != 0
 
     def commit_reserve_squad(self):
         """Move one squad from reserve to active"""
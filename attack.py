@@ -5,18 +5,15 @@ import pygame
 from core.entity import Entity
 from core.component import Transform, Sprite
 
+# Number of pre-faded copies of each attack surface (last one fully opaque)
+ATTACK_FADE_LEVELS = 16
 
-def create_attack(entity_manager, x, y, radius, damage, duration, team=0, color=(255, 255, 100)):
-    """Create a visual attack entity"""
-    entity = entity_manager.create_entity()
-    entity.add_tag("attack")
-    entity.add_tag(f"team_{team}")
+# Pre-faded attack surfaces, (radius, color) -> tuple of ATTACK_FADE_LEVELS surfaces
+_ATTACK_FADE_CACHE = {}
 
-    # Transform at attack position
-    transform = Transform(x, y)
-    entity.add_component("Transform", transform)
 
-    # Create visual sprite
+def _draw_attack_surface(radius, color):
+    """Draw the attack sprite (glowing circle)"""
     size = int(radius * 2)
     surface = pygame.Surface((size, size), pygame.SRCALPHA)
 
@@ -29,13 +26,47 @@ def create_attack(entity_manager, x, y, radius, damage, duration, team=0, color=
     pygame.draw.circle(surface, (255, 255, 255, 200), (radius, radius), int(radius * 0.4))
     # Outline
     pygame.draw.circle(surface, color, (radius, radius), radius, 3)
+    return surface
+
+
+def _attack_fade_frames(radius, color):
+    """Get the pre-faded surfaces for an attack, drawing them on first use"""
+    key = (radius, tuple(color))
+    frames = _ATTACK_FADE_CACHE.get(key)
+    if frames is None:
+        base = _draw_attack_surface(radius, color)
+        frames = []
+        for level in range(ATTACK_FADE_LEVELS):
+            alpha = round(level * 255 / (ATTACK_FADE_LEVELS - 1))
+            frame = base.copy()
+            # Bake the fade into the per-pixel alpha
+            frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            frames.append(frame)
+        frames = _ATTACK_FADE_CACHE[key] = tuple(frames)
+    return frames
+
 
-    sprite = Sprite(surface, size, size)
+def create_attack(entity_manager, x, y, radius, damage, duration, team=0, color=(255, 255, 100)):
+    """Create a visual attack entity"""
+    entity = entity_manager.create_entity()
+    entity.add_tag("attack")
+    entity.add_tag(f"team_{team}")
+
+    # Transform at attack position
+    transform = Transform(x, y)
+    entity.add_component("Transform", transform)
+
+    # Create visual sprite (shared, pre-faded surfaces; starts fully opaque)
+    size = int(radius * 2)
+    fade_frames = _attack_fade_frames(radius, color)
+
+    sprite = Sprite(fade_frames[-1], size, size)
     sprite.layer = 10  # Draw on top
     entity.add_component("Sprite", sprite)
 
     # Attack data component
     attack_data = AttackData(radius, damage, duration, team)
+    attack_data.fade_frames = fade_frames
     entity.add_component("AttackData", attack_data)
 
     return entity
@@ -43,6 +74,8 @@ def create_attack(entity_manager, x, y, radius, damage, duration, team=0, color=
 
 class AttackData:
     """Component holding attack information"""
+    __slots__ = ("entity", "radius", "damage", "duration", "timer", "team", "hit_entities", "fade_frames")
+
     def __init__(self, radius, damage, duration, team):
         self.radius = radius
         self.damage = damage
@@ -50,6 +83,7 @@ class AttackData:
         self.timer = duration
         self.team = team
         self.hit_entities = set()  # Track what we've already hit
+        self.fade_frames = None  # Pre-faded sprite surfaces, transparent -> opaque
 
     def update(self, dt):
         """Update attack lifetime"""
@@ -83,8 +117,8 @@ class AttackSystem:
                 continue
 
             attack_data = attack.get_component("AttackData")
-            transform = attack.get_component("Transform")
-            sprite = attack.get_component("Sprite")
+            transform = attack.transform
+            sprite = attack.sprite
 
             if not attack_data or not transform:
                 continue
@@ -94,15 +128,11 @@ class AttackSystem:
                 attack.destroy()
                 continue
 
-            # Update visual (fade out)
-            if sprite and sprite.surface:
-                alpha = int((attack_data.timer / attack_data.duration) * 255)
-                sprite.surface.set_alpha(alpha)
-
-            # Check for hits
-            nearby = self.collision_system.spatial_hash.query_radius(
-                transform.x, transform.y, attack_data.radius
-            )
+            # Update visual (fade out by swapping to a pre-faded surface)
+            fade_frames = attack_data.fade_frames
+            if sprite and fade_frames:
+                level = int((attack_data.timer / attack_data.duration) * (len(fade_frames) - 1))
+                sprite.surface = fade_frames[max(0, min(level, len(fade_frames) - 1))]
 
             # AttackSystem is VISUAL ONLY - damage is handled by CombatSystem
             # This system just manages attack entity lifetime and visuals
@@ -2,8 +2,53 @@
 Blackboard system for shared battlefield intelligence
 All AI units can read/write to coordinate strategies
 """
-import math
+import heapq
+import itertools
+import logging
+import numpy as np
 from collections import defaultdict
+from enum import IntEnum
+from core.spatial import SpatialHash
+
+logger = logging.getLogger(__name__)
+
+# Combat power of a unit by rank, for local superiority
+RANK_COMBAT_POWER = {
+    "soldier": 1.0,
+    "officer": 2.0,
+    "general": 3.0
+}
+
+# Entity tag for each army team id
+TEAM_TAGS = ("team_0", "team_1")
+
+# Cell size of the per-team unit index (threat queries use 300-400px radii)
+UNIT_INDEX_CELL_SIZE = 200
+
+
+class Order(IntEnum):
+    """
+    Strategy / order types shared by generals, officers and formations.
+    A general's strategy is passed down unchanged as its officers' order type.
+    """
+    ADVANCE = 0
+    ATTACK = 1
+    DEFEND = 2
+    RETREAT = 3
+    DESPERATE_ATTACK = 4
+    EXPAND = 5
+    MOVE = 6
+    CAPTURE = 7
+    REGROUP = 8
+    SKIRMISH = 9
+
+
+class Threat(IntEnum):
+    """Local threat levels, in escalating order (usable as table indices)"""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    OVERWHELMING = 3
 
 
 class BattlefieldBlackboard:
@@ -17,9 +62,16 @@ class BattlefieldBlackboard:
 
         # Tactical data (written by Officers)
         self.squad_assignments = {}  # squad_id -> {"officer_id": X, "soldier_ids": [], "formation": "line"}
+        self.squads_by_team = {0: [], 1: []}  # team_id -> [squad_ids], in registration order
+        self._soldier_to_squad = {}  # soldier_id -> squad_id, mirrors squad "soldier_ids"
         self.squad_positions = {}  # squad_id -> (x, y)
         self.squad_targets = {}  # squad_id -> entity_id or (x, y)
 
+        # Per-team spatial index of live units, rebuilt each tick by index_units()
+        self.team_unit_index = {}  # team_id -> SpatialHash
+        self.unit_arrays = None  # (xs, ys, power, team) NumPy arrays of the same units, both teams
+        self.team_unit_counts = {}  # team_id -> team_stats dict counted during the same pass
+
         # Battlefield intelligence (written by all)
         self.known_enemies = defaultdict(list)  # team_id -> [enemy_positions]
         self.known_threats = defaultdict(list)  # team_id -> [(x, y, threat_level)]
@@ -31,11 +83,14 @@ class BattlefieldBlackboard:
 
         # Scout system
         self.squad_scouts = {}  # squad_id -> [soldier_ids] of scouts
+        self._scout_to_squad = {}  # scout_id -> squad_id, mirrors squad_scouts
         self.scout_positions = {}  # scout_id -> (patrol_x, patrol_y) patrol position
         self.scout_reports = []  # [(scout_id, enemy_pos, game_time, enemy_type)]
 
         # Command system (delays and signal radius)
-        self.pending_orders = []  # [(order_time, recipient_id, order_data)]
+        # recipient_id -> min-heap of (order_time, sequence, order_data); sequence keeps issue order on ties
+        self.pending_orders = defaultdict(list)
+        self._order_sequence = itertools.count()
         self.command_delays = {
             "general_to_officer": 0.5,  # 0.5s delay
             "officer_to_soldier": 0.2,  # 0.2s delay
@@ -50,7 +105,7 @@ class BattlefieldBlackboard:
     def set_strategic_goal(self, team_id, objective_type, target_data):
         """General sets strategic goal for entire team"""
         self.strategic_goals[team_id] = {
-            "objective": objective_type,  # "attack_base", "defend_base", "advance", "retreat"
+            "objective": objective_type,  # Order member (Order.ATTACK, Order.DEFEND, ...)
             "target": target_data,
             "priority": 1.0
         }
@@ -59,13 +114,20 @@ class BattlefieldBlackboard:
         """Get current strategic goal for team"""
         return self.strategic_goals.get(team_id, None)
 
-    def register_squad(self, squad_id, officer_id, formation="line"):
-        """Officer registers their squad"""
+    def register_squad(self, squad_id, officer_id, formation="line", team_id=None):
+        """Officer registers their squad (team_id also lists it in squads_by_team)"""
+        if team_id is not None and squad_id not in self.squad_assignments:
+            self.squads_by_team.setdefault(team_id, []).append(squad_id)
+        old_squad = self.squad_assignments.get(squad_id)
+        if old_squad:
+            for soldier_id in old_squad["soldier_ids"]:
+                self._soldier_to_squad.pop(soldier_id, None)
         self.squad_assignments[squad_id] = {
             "officer_id": officer_id,
             "soldier_ids": [],
             "formation": formation,
-            "max_size": 10
+            "max_size": 10,
+            "roster_version": 0  # Bumped whenever soldier_ids changes
         }
         self.squad_cohesion[squad_id] = 1.0
 
@@ -75,15 +137,32 @@ class BattlefieldBlackboard:
             squad = self.squad_assignments[squad_id]
             if len(squad["soldier_ids"]) < squad["max_size"]:
                 squad["soldier_ids"].append(soldier_id)
+                squad["roster_version"] += 1
+                self._soldier_to_squad[soldier_id] = squad_id
                 return True
         return False
 
+    def add_soldiers_to_squad(self, squad_id, soldier_ids):
+        """Add several soldiers to squad at once (up to max_size). Returns the ids that were added"""
+        squad = self.squad_assignments.get(squad_id)
+        if not squad:
+            return []
+        room = squad["max_size"] - len(squad["soldier_ids"])
+        added = soldier_ids[:max(0, room)]
+        squad["soldier_ids"].extend(added)
+        squad["roster_version"] += 1
+        for soldier_id in added:
+            self._soldier_to_squad[soldier_id] = squad_id
+        return added
+
     def remove_soldier_from_squad(self, squad_id, soldier_id):
         """Remove soldier from squad (death or reassignment)"""
-        if squad_id in self.squad_assignments:
-            squad = self.squad_assignments[squad_id]
-            if soldier_id in squad["soldier_ids"]:
-                squad["soldier_ids"].remove(soldier_id)
+        if self._soldier_to_squad.get(soldier_id) != squad_id:
+            return
+        del self._soldier_to_squad[soldier_id]
+        squad = self.squad_assignments[squad_id]
+        squad["soldier_ids"].remove(soldier_id)  # Ordered list (formation slots), at most max_size long
+        squad["roster_version"] += 1
 
     def get_squad_info(self, squad_id):
         """Get squad information"""
@@ -91,10 +170,7 @@ class BattlefieldBlackboard:
 
     def get_soldier_squad(self, soldier_id):
         """Find which squad a soldier belongs to"""
-        for squad_id, squad_data in self.squad_assignments.items():
-            if soldier_id in squad_data["soldier_ids"]:
-                return squad_id
-        return None
+        return self._soldier_to_squad.get(soldier_id)
 
     def update_squad_position(self, squad_id, x, y):
         """Officer updates squad position"""
@@ -140,34 +216,39 @@ class BattlefieldBlackboard:
         """Issue order with realistic delay"""
         delay = self.command_delays.get(command_type, 0.1)
         delivery_time = current_time + delay
-        self.pending_orders.append((delivery_time, recipient_id, order_data))
+        heapq.heappush(self.pending_orders[recipient_id],
+                       (delivery_time, next(self._order_sequence), order_data))
 
     def get_orders_for_unit(self, unit_id, current_time):
-        """Get any orders ready for this unit"""
-        ready_orders = []
-        remaining_orders = []
+        """Get any orders ready for this unit (a shared empty tuple when none are due)"""
+        heap = self.pending_orders.get(unit_id)
+        if not heap or heap[0][0] > current_time:
+            return ()
 
-        for order_time, recipient_id, order_data in self.pending_orders:
-            if recipient_id == unit_id and order_time <= current_time:
-                ready_orders.append(order_data)
-            else:
-                remaining_orders.append((order_time, recipient_id, order_data))
+        ready_orders = []
+        while heap and heap[0][0] <= current_time:
+            ready_orders.append(heapq.heappop(heap)[2])
 
-        self.pending_orders = remaining_orders
+        if not heap:
+            del self.pending_orders[unit_id]
         return ready_orders
 
     def update_team_stats(self, team_id, entity_manager):
-        """Update team statistics from entity manager"""
+        """Update team statistics (counted by index_units this tick, else from entity manager)"""
+        counts = self.team_unit_counts.get(team_id)
+        if counts is not None:
+            self.team_stats[team_id] = dict(counts)
+            return
+
         stats = {"total_units": 0, "soldiers": 0, "officers": 0, "generals": 0, "casualties": 0}
 
-        team_tag = f"team_{team_id}"
-        units = entity_manager.get_entities_with_tag(team_tag)
+        units = entity_manager.get_entities_with_tag(TEAM_TAGS[team_id])
 
         for unit in units:
             if not unit.active:
                 continue
 
-            health = unit.get_component("Health")
+            health = unit.health
             if health and health.dead:
                 stats["casualties"] += 1
                 continue
@@ -187,56 +268,80 @@ class BattlefieldBlackboard:
         """Get team statistics"""
         return self.team_stats.get(team_id, {})
 
+    def index_units(self, entity_manager):
+        """
+        Rebuild the per-team spatial index, position/power arrays and unit counts.
+        Called once per tick; local superiority / threat queries read the arrays,
+        soldier enemy scans the spatial index, update_team_stats the counts.
+        """
+        xs = []
+        ys = []
+        power = []
+        teams = []
+        for team_id, team_tag in enumerate(TEAM_TAGS):
+            index = self.team_unit_index.get(team_id)
+            if index is None:
+                index = self.team_unit_index[team_id] = SpatialHash(cell_size=UNIT_INDEX_CELL_SIZE)
+            else:
+                index.clear()
+
+            counts = {"total_units": 0, "soldiers": 0, "officers": 0, "generals": 0, "casualties": 0}
+            for unit_entity in entity_manager.get_entities_with_tag(team_tag):
+                health = unit_entity.health
+                if health and health.dead:
+                    counts["casualties"] += 1
+                    continue
+                counts["total_units"] += 1
+                if unit_entity.has_tag("soldier"):
+                    counts["soldiers"] += 1
+                elif unit_entity.has_tag("officer"):
+                    counts["officers"] += 1
+                elif unit_entity.has_tag("general"):
+                    counts["generals"] += 1
+                transform = unit_entity.transform
+                if transform:
+                    index.insert_unchecked(unit_entity, transform.x, transform.y)
+                    unit = unit_entity.unit
+                    xs.append(transform.x)
+                    ys.append(transform.y)
+                    power.append(unit.combat_power if unit else 1.0)
+                    teams.append(team_id)
+
+            self.team_unit_counts[team_id] = counts
+
+        self.unit_arrays = (np.array(xs), np.array(ys), np.array(power), np.array(teams, dtype=np.intp))
+
     def calculate_local_superiority(self, team_id, x, y, radius, entity_manager):
         """Calculate if team has local superiority at position (power-based, not count-based)"""
-        team_tag = f"team_{team_id}"
-        enemy_team = 1 - team_id  # Simple 2-team system
-        enemy_tag = f"team_{enemy_team}"
-
-        RANK_COMBAT_POWER = {
-            "soldier": 1.0,
-            "officer": 2.0,
-            "general": 3.0
-        }
-
-        friendly_power = 0.0
-        enemy_power = 0.0
-
-        # Count friendly units with rank weighting
-        for unit_entity in entity_manager.get_entities_with_tag(team_tag):
-            if not unit_entity.active:
-                continue
-
-            health = unit_entity.get_component("Health")
-            if health and health.dead:
-                continue
-
-            transform = unit_entity.get_component("Transform")
-            if transform:
-                dx = transform.x - x
-                dy = transform.y - y
-                if math.sqrt(dx*dx + dy*dy) <= radius:
-                    unit = unit_entity.get_component("Unit")
-                    power = RANK_COMBAT_POWER.get(unit.rank, 1.0) if unit else 1.0
-                    friendly_power += power
-
-        # Count enemy units with rank weighting
-        for unit_entity in entity_manager.get_entities_with_tag(enemy_tag):
-            if not unit_entity.active:
-                continue
-
-            health = unit_entity.get_component("Health")
-            if health and health.dead:
-                continue
-
-            transform = unit_entity.get_component("Transform")
-            if transform:
-                dx = transform.x - x
-                dy = transform.y - y
-                if math.sqrt(dx*dx + dy*dy) <= radius:
-                    unit = unit_entity.get_component("Unit")
-                    power = RANK_COMBAT_POWER.get(unit.rank, 1.0) if unit else 1.0
-                    enemy_power += power
+        radius_sq = radius * radius
+        if self.unit_arrays is not None:
+            # One vectorized pass over this tick's snapshot of both teams
+            xs, ys, power, teams = self.unit_arrays
+            dx = xs - x
+            dy = ys - y
+            in_radius = dx*dx + dy*dy <= radius_sq
+            team_power = np.bincount(teams[in_radius], weights=power[in_radius], minlength=len(TEAM_TAGS))
+        else:
+            # Not indexed yet this run - scan both teams in one pass
+            team_power = [0.0] * len(TEAM_TAGS)
+            for team, team_tag in enumerate(TEAM_TAGS):
+                for unit_entity in entity_manager.get_entities_with_tag(team_tag):
+                    transform = unit_entity.transform
+                    if not transform:
+                        continue
+                    dx = transform.x - x
+                    dy = transform.y - y
+                    if dx*dx + dy*dy > radius_sq:
+                        continue
+                    health = unit_entity.health
+                    if health and health.dead:
+                        continue
+                    unit = unit_entity.unit
+                    team_power[team] += unit.combat_power if unit else 1.0
+
+        # Rank-weighted power of each side within radius (simple 2-team system)
+        friendly_power = float(team_power[team_id])
+        enemy_power = float(team_power[1 - team_id])
 
         total_power = friendly_power + enemy_power
         if total_power == 0:
@@ -247,23 +352,26 @@ class BattlefieldBlackboard:
     def calculate_threat_level(self, team_id, x, y, radius, entity_manager):
         """
         Calculate threat level at location.
-        Returns: "low", "medium", "high", "overwhelming"
+        Returns: Threat.LOW, Threat.MEDIUM, Threat.HIGH or Threat.OVERWHELMING
         """
         superiority = self.calculate_local_superiority(team_id, x, y, radius, entity_manager)
 
         # Convert superiority to threat level
         if superiority >= 0.7:
-            return "low"  # We dominate
+            return Threat.LOW  # We dominate
         elif superiority >= 0.5:
-            return "medium"  # Even fight
+            return Threat.MEDIUM  # Even fight
         elif superiority >= 0.3:
-            return "high"  # Enemy has advantage
+            return Threat.HIGH  # Enemy has advantage
         else:
-            return "overwhelming"  # Enemy dominates
+            return Threat.OVERWHELMING  # Enemy dominates
 
     def assign_scouts(self, squad_id, scout_ids, patrol_positions):
         """Assign scouts to a squad with patrol positions"""
+        self._forget_scouts(squad_id)
         self.squad_scouts[squad_id] = scout_ids
+        for scout_id in scout_ids:
+            self._scout_to_squad[scout_id] = squad_id
         for i, scout_id in enumerate(scout_ids):
             if i < len(patrol_positions):
                 self.scout_positions[scout_id] = patrol_positions[i]
@@ -274,10 +382,7 @@ class BattlefieldBlackboard:
 
     def is_scout(self, soldier_id):
         """Check if a soldier is assigned as scout"""
-        for squad_id, scouts in self.squad_scouts.items():
-            if soldier_id in scouts:
-                return True
-        return False
+        return soldier_id in self._scout_to_squad
 
     def get_scout_patrol_position(self, soldier_id):
         """Get patrol position for a scout"""
@@ -286,13 +391,18 @@ class BattlefieldBlackboard:
     def report_scout_sighting(self, scout_id, enemy_pos, game_time, enemy_type="unknown"):
         """Scout reports enemy sighting"""
         self.scout_reports.append((scout_id, enemy_pos, game_time, enemy_type))
-        print(f"[SCOUT {scout_id}] Enemy {enemy_type} spotted at ({int(enemy_pos[0])}, {int(enemy_pos[1])})")
+        logger.debug("[SCOUT %s] Enemy %s spotted at (%d, %d)", scout_id, enemy_type, enemy_pos[0], enemy_pos[1])
 
     def recall_scouts(self, squad_id):
         """Recall all scouts for a squad"""
         if squad_id in self.squad_scouts:
-            scouts = self.squad_scouts[squad_id]
-            for scout_id in scouts:
-                if scout_id in self.scout_positions:
-                    del self.scout_positions[scout_id]
+            for scout_id in self.squad_scouts[squad_id]:
+                self.scout_positions.pop(scout_id, None)
+            self._forget_scouts(squad_id)
             self.squad_scouts[squad_id] = []
+
+    def _forget_scouts(self, squad_id):
+        """Drop squad_id's current scouts from the scout reverse index"""
+        for scout_id in self.squad_scouts.get(squad_id, ()):
+            if self._scout_to_squad.get(scout_id) == squad_id:
+                del self._scout_to_squad[scout_id]
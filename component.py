@@ -4,6 +4,8 @@ Component base class for Entity-Component System
 
 class Component:
     """Base component class"""
+    __slots__ = ("entity",)
+
     def __init__(self):
         self.entity = None
 
@@ -14,6 +16,8 @@ class Component:
 
 class Transform(Component):
     """Position, rotation, scale component"""
+    __slots__ = ("x", "y", "rotation", "vx", "vy")
+
     def __init__(self, x=0, y=0, rotation=0):
         super().__init__()
         self.x = x
@@ -41,6 +45,8 @@ class Transform(Component):
 
 class Sprite(Component):
     """Rendering component"""
+    __slots__ = ("surface", "width", "height", "visible", "layer")
+
     def __init__(self, surface, width=32, height=32):
         super().__init__()
         self.surface = surface
@@ -51,8 +57,8 @@ class Sprite(Component):
 
     def get_rect(self):
         """Get rect for the sprite based on entity transform"""
-        if self.entity and 'Transform' in self.entity.components:
-            transform = self.entity.components['Transform']
+        transform = self.entity.transform if self.entity else None
+        if transform:
             return (transform.x - self.width // 2,
                    transform.y - self.height // 2,
                    self.width, self.height)
@@ -66,6 +72,8 @@ class Sprite(Component):
 
 class Health(Component):
     """Health/damage component"""
+    __slots__ = ("max_health", "current_health", "invulnerable", "dead")
+
     def __init__(self, max_health=100):
         super().__init__()
         self.max_health = max_health
@@ -100,6 +108,8 @@ class Health(Component):
 
 class Combat(Component):
     """Combat stats component"""
+    __slots__ = ("damage", "attack_range", "attack_cooldown", "cooldown_timer", "team")
+
     def __init__(self, damage=10, attack_range=50, attack_cooldown=1.0):
         super().__init__()
         self.damage = damage
@@ -122,6 +132,8 @@ class Combat(Component):
 
 class AI(Component):
     """AI state machine component"""
+    __slots__ = ("state", "target", "state_timer", "decision_cooldown", "decision_timer")
+
     def __init__(self, initial_state="idle"):
         super().__init__()
         self.state = initial_state
@@ -3,10 +3,27 @@ Damage popup system for floating damage numbers
 """
 import pygame
 
+# Number of pre-faded copies of each popup text (last one fully opaque)
+POPUP_FADE_LEVELS = 16
+
+
+def _render_fade_frames(font, text, color):
+    """Render text once and bake POPUP_FADE_LEVELS alpha levels into copies of it"""
+    base = font.render(text, True, color)
+    if pygame.display.get_surface() is not None:
+        base = base.convert_alpha()
+    frames = []
+    for level in range(POPUP_FADE_LEVELS):
+        alpha = round(level * 255 / (POPUP_FADE_LEVELS - 1))
+        frame = base.copy()
+        frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        frames.append(frame)
+    return tuple(frames)
+
 
 class DamagePopup:
     """Floating damage number that rises and fades"""
-    def __init__(self, pos, value, color=(255, 220, 100)):
+    def __init__(self, pos, value, color=(255, 220, 100), fade_frames=None):
         self.pos = pygame.Vector2(pos)
         self.value = str(value)
         self.color = color
@@ -14,6 +31,7 @@ class DamagePopup:
         self.age = 0.0
         self.vel = pygame.Vector2(0, -60)
         self.alive = True
+        self.fade_frames = fade_frames  # Pre-faded text surfaces, transparent -> opaque
 
     def update(self, dt):
         """Update position and check lifetime"""
@@ -22,15 +40,20 @@ class DamagePopup:
         if self.age >= self.lifetime:
             self.alive = False
 
+    def current_surface(self, font):
+        """Get the pre-faded text surface for the popup's current age"""
+        frames = self.fade_frames
+        if frames is None:
+            frames = self.fade_frames = _render_fade_frames(font, self.value, self.color)
+        level = int((1 - self.age / self.lifetime) * (len(frames) - 1))
+        return frames[max(0, min(level, len(frames) - 1))]
+
     def draw(self, surf, font, camera_offset=(0, 0)):
         """Draw popup with alpha fade"""
         if not self.alive:
             return
-        alpha = int(255 * (1 - self.age / self.lifetime))
-        text = font.render(self.value, True, self.color)
-        text.set_alpha(alpha)
         screen_pos = (self.pos.x - camera_offset[0], self.pos.y - camera_offset[1])
-        surf.blit(text, screen_pos)
+        surf.blit(self.current_surface(font), screen_pos)
 
 
 class PopupSystem:
@@ -38,10 +61,15 @@ class PopupSystem:
     def __init__(self):
         self.popups = []
         self.font = pygame.font.SysFont(None, 24)
+        self._text_cache = {}  # (text, color) -> pre-faded text surfaces
 
     def spawn(self, pos, value, color=(255, 220, 100)):
         """Spawn a damage popup at position"""
-        self.popups.append(DamagePopup(pos, value, color))
+        key = (str(value), color)
+        frames = self._text_cache.get(key)
+        if frames is None:
+            frames = self._text_cache[key] = _render_fade_frames(self.font, key[0], color)
+        self.popups.append(DamagePopup(pos, value, color, frames))
 
     def update(self, dt):
         """Update all popups and remove dead ones"""
@@ -50,6 +78,7 @@ class PopupSystem:
         self.popups = [p for p in self.popups if p.alive]
 
     def draw(self, surf, camera_offset=(0, 0)):
-        """Draw all popups"""
-        for p in self.popups:
-            p.draw(surf, self.font, camera_offset)
+        """Draw all popups in one blits call"""
+        offset_x, offset_y = camera_offset
+        surf.blits([(p.current_surface(self.font), (p.pos.x - offset_x, p.pos.y - offset_y))
+                    for p in self.popups if p.alive], doreturn=False)
@@ -7,6 +7,9 @@ import random
 from core.entity import Entity
 from core.component import Transform, Sprite, Health, Combat, AI
 
+# Enemy sprite surfaces, enemy type -> pygame.Surface shared by every enemy of that type
+_SPRITE_CACHE = {}
+
 
 class EnemyAI(AI):
     """Extended AI component for enemies"""
@@ -18,6 +21,27 @@ class EnemyAI(AI):
         self.chase_speed = 120
         self.follow_flowfield = True
 
+    # Squared FSM thresholds are kept in sync by the range setters
+    @property
+    def aggro_range(self):
+        return self._aggro_range
+
+    @aggro_range.setter
+    def aggro_range(self, value):
+        self._aggro_range = value
+        self.aggro_sq = value * value  # Start chasing inside this
+        self.aggro_lost_sq = (value * 1.5) ** 2  # Give up the chase outside this
+
+    @property
+    def attack_range(self):
+        return self._attack_range
+
+    @attack_range.setter
+    def attack_range(self, value):
+        self._attack_range = value
+        self.attack_sq = value * value  # Start attacking inside this
+        self.attack_leave_sq = (value * 1.5) ** 2  # Resume chasing outside this
+
     def reset(self):
         """Reset AI state"""
         self.state = "idle"
@@ -26,16 +50,20 @@ class EnemyAI(AI):
         self.decision_timer = 0
 
 
-def create_grunt(entity_manager, x, y):
-    """Create a basic grunt enemy"""
-    entity = entity_manager.create_entity()
-    entity.add_tag("enemy")
-    entity.add_tag("grunt")
+def _enemy_surface(enemy_type):
+    """Get the shared sprite surface for enemy_type, drawing it on first use"""
+    surface = _SPRITE_CACHE.get(enemy_type)
+    if surface is None:
+        surface = _SURFACE_DRAWERS[enemy_type]()
+        # Match the display pixel format so blits take the fast path
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        _SPRITE_CACHE[enemy_type] = surface
+    return surface
 
-    transform = Transform(x, y)
-    entity.add_component("Transform", transform)
 
-    # Create sprite - MUCH BIGGER and MORE VISIBLE
+def _draw_grunt_surface():
+    """Draw the grunt sprite"""
     surface = pygame.Surface((48, 48), pygame.SRCALPHA)
     # Bright red body (opaque, not transparent)
     pygame.draw.circle(surface, (255, 50, 50), (24, 24), 22)
@@ -49,7 +77,47 @@ def create_grunt(entity_manager, x, y):
     # Add a health bar on top for visibility
     pygame.draw.rect(surface, (0, 0, 0), (4, 2, 40, 4))
     pygame.draw.rect(surface, (0, 255, 0), (5, 3, 38, 2))
-    sprite = Sprite(surface, 48, 48)
+    return surface
+
+
+def _draw_officer_surface():
+    """Draw the officer sprite"""
+    surface = pygame.Surface((64, 64), pygame.SRCALPHA)
+    # Bright purple/magenta body (opaque)
+    pygame.draw.circle(surface, (255, 0, 255), (32, 32), 30)
+    # Black outline (very thick and visible)
+    pygame.draw.circle(surface, (0, 0, 0), (32, 32), 30, 4)
+    # Bright yellow eyes (big and obvious)
+    pygame.draw.circle(surface, (255, 255, 0), (20, 28), 8)
+    pygame.draw.circle(surface, (255, 255, 0), (44, 28), 8)
+    pygame.draw.circle(surface, (0, 0, 0), (20, 28), 4)
+    pygame.draw.circle(surface, (0, 0, 0), (44, 28), 4)
+    # Large crown to indicate officer
+    pygame.draw.polygon(surface, (255, 215, 0), [(16, 10), (32, 2), (48, 10), (42, 18), (32, 14), (22, 18)])
+    pygame.draw.polygon(surface, (0, 0, 0), [(16, 10), (32, 2), (48, 10), (42, 18), (32, 14), (22, 18)], 2)
+    # Add a health bar on top for visibility
+    pygame.draw.rect(surface, (0, 0, 0), (8, 4, 48, 6))
+    pygame.draw.rect(surface, (255, 215, 0), (9, 5, 46, 4))
+    return surface
+
+
+_SURFACE_DRAWERS = {
+    "grunt": _draw_grunt_surface,
+    "officer": _draw_officer_surface,
+}
+
+
+def create_grunt(entity_manager, x, y):
+    """Create a basic grunt enemy"""
+    entity = entity_manager.create_entity()
+    entity.add_tag("enemy")
+    entity.add_tag("grunt")
+
+    transform = Transform(x, y)
+    entity.add_component("Transform", transform)
+
+    # Create sprite (shared) - MUCH BIGGER and MORE VISIBLE
+    sprite = Sprite(_enemy_surface("grunt"), 48, 48)
     sprite.layer = 5  # Render on top of most things
     entity.add_component("Sprite", sprite)
 
@@ -76,24 +144,8 @@ def create_officer(entity_manager, x, y):
     transform = Transform(x, y)
     entity.add_component("Transform", transform)
 
-    # Create sprite - MUCH BIGGER and MORE VISIBLE
-    surface = pygame.Surface((64, 64), pygame.SRCALPHA)
-    # Bright purple/magenta body (opaque)
-    pygame.draw.circle(surface, (255, 0, 255), (32, 32), 30)
-    # Black outline (very thick and visible)
-    pygame.draw.circle(surface, (0, 0, 0), (32, 32), 30, 4)
-    # Bright yellow eyes (big and obvious)
-    pygame.draw.circle(surface, (255, 255, 0), (20, 28), 8)
-    pygame.draw.circle(surface, (255, 255, 0), (44, 28), 8)
-    pygame.draw.circle(surface, (0, 0, 0), (20, 28), 4)
-    pygame.draw.circle(surface, (0, 0, 0), (44, 28), 4)
-    # Large crown to indicate officer
-    pygame.draw.polygon(surface, (255, 215, 0), [(16, 10), (32, 2), (48, 10), (42, 18), (32, 14), (22, 18)])
-    pygame.draw.polygon(surface, (0, 0, 0), [(16, 10), (32, 2), (48, 10), (42, 18), (32, 14), (22, 18)], 2)
-    # Add a health bar on top for visibility
-    pygame.draw.rect(surface, (0, 0, 0), (8, 4, 48, 6))
-    pygame.draw.rect(surface, (255, 215, 0), (9, 5, 46, 4))
-    sprite = Sprite(surface, 64, 64)
+    # Create sprite (shared) - MUCH BIGGER and MORE VISIBLE
+    sprite = Sprite(_enemy_surface("officer"), 64, 64)
     sprite.layer = 5  # Render on top of most things
     entity.add_component("Sprite", sprite)
 
@@ -121,7 +173,7 @@ class EnemyAISystem:
     def update(self, dt):
         """Update all enemy AI"""
         try:
-            enemies = self.entity_manager.get_entities_with_tag("enemy")
+            enemies = self.entity_manager.get_tag_bucket("enemy")
             players = self.entity_manager.get_entities_with_tag("player")
 
             if not players:
@@ -139,13 +191,13 @@ class EnemyAISystem:
                     continue
 
                 # Skip dead enemies - they shouldn't think or move
-                health = enemy.get_component("Health")
+                health = enemy.health
                 if health and health.dead:
                     continue
 
-                transform = enemy.get_component("Transform")
-                ai = enemy.get_component("AI")
-                combat = enemy.get_component("Combat")
+                transform = enemy.transform
+                ai = enemy.ai
+                combat = enemy.combat
 
                 if not transform or not ai:
                     continue
@@ -155,12 +207,12 @@ class EnemyAISystem:
                 # Calculate distance to player
                 dx = player_pos[0] - transform.x
                 dy = player_pos[1] - transform.y
-                distance = math.sqrt(dx*dx + dy*dy)
+                dist_sq = dx*dx + dy*dy
 
                 # FSM logic
                 if ai.state == "idle":
                     # Idle state - check for aggro
-                    if distance < ai.aggro_range:
+                    if dist_sq < ai.aggro_sq:
                         ai.change_state("chase")
                     else:
                         # Wander randomly
@@ -173,9 +225,9 @@ class EnemyAISystem:
 
                 elif ai.state == "chase":
                     # Chase player
-                    if distance < ai.attack_range:
+                    if dist_sq < ai.attack_sq:
                         ai.change_state("attack")
-                    elif distance > ai.aggro_range * 1.5:
+                    elif dist_sq > ai.aggro_lost_sq:
                         # Lost aggro
                         ai.change_state("idle")
                     else:
@@ -187,28 +239,26 @@ class EnemyAISystem:
                                 transform.vy = direction[1] * ai.chase_speed
                             else:
                                 # Fallback to direct movement
-                                if distance > 0:  # Prevent division by zero
-                                    direction_x = dx / distance
-                                    direction_y = dy / distance
-                                    transform.vx = direction_x * ai.chase_speed
-                                    transform.vy = direction_y * ai.chase_speed
+                                if dist_sq > 0:  # Prevent division by zero
+                                    inv = ai.chase_speed / math.sqrt(dist_sq)
+                                    transform.vx = dx * inv
+                                    transform.vy = dy * inv
                                 else:
                                     transform.vx = 0
                                     transform.vy = 0
                         else:
                             # Direct movement
-                            if distance > 0:  # Prevent division by zero
-                                direction_x = dx / distance
-                                direction_y = dy / distance
-                                transform.vx = direction_x * ai.chase_speed
-                                transform.vy = direction_y * ai.chase_speed
+                            if dist_sq > 0:  # Prevent division by zero
+                                inv = ai.chase_speed / math.sqrt(dist_sq)
+                                transform.vx = dx * inv
+                                transform.vy = dy * inv
                             else:
                                 transform.vx = 0
                                 transform.vy = 0
 
                 elif ai.state == "attack":
                     # Attack player
-                    if distance > ai.attack_range * 1.5:
+                    if dist_sq > ai.attack_leave_sq:
                         ai.change_state("chase")
                     else:
                         # Stop and attack
@@ -2,8 +2,21 @@
 Entity class for Entity-Component System
 """
 
+# Hot components mirrored onto entity attributes (component_name -> attribute)
+# so AI loops can use entity.transform instead of get_component("Transform")
+FAST_COMPONENT_ATTRS = {
+    "Transform": "transform",
+    "Unit": "unit",
+    "Health": "health",
+    "Sprite": "sprite",
+    "Combat": "combat",
+    "AI": "ai",
+}
+
+
 class Entity:
     """Entity that holds components"""
+    __slots__ = ("id", "components", "active", "tags", "_manager") + tuple(FAST_COMPONENT_ATTRS.values())
     _next_id = 0
 
     def __init__(self):
@@ -12,11 +25,23 @@ class Entity:
         self.components = {}
         self.active = True
         self.tags = set()
+        self._manager = None  # Owning EntityManager, notified of new tags
+
+        # Fast component attributes (see FAST_COMPONENT_ATTRS)
+        self.transform = None
+        self.unit = None
+        self.health = None
+        self.sprite = None
+        self.combat = None
+        self.ai = None
 
     def add_component(self, component_name, component):
         """Add a component to this entity"""
         self.components[component_name] = component
         component.entity = self
+        attr = FAST_COMPONENT_ATTRS.get(component_name)
+        if attr:
+            setattr(self, attr, component)
         return self
 
     def get_component(self, component_name):
@@ -31,10 +56,17 @@ class Entity:
         """Remove a component"""
         if component_name in self.components:
             del self.components[component_name]
+            attr = FAST_COMPONENT_ATTRS.get(component_name)
+            if attr:
+                setattr(self, attr, None)
 
     def add_tag(self, tag):
         """Add a tag to this entity"""
+        if tag in self.tags:
+            return
         self.tags.add(tag)
+        if self._manager is not None:
+            self._manager._index_tag(self, tag)
 
     def has_tag(self, tag):
         """Check if entity has a tag"""
@@ -53,25 +85,60 @@ class EntityManager:
     """Manages all entities"""
     def __init__(self):
         self.entities = []
-        self.entities_by_tag = {}
+        self.entities_by_tag = {}  # tag -> entities with that tag (active or not)
+        self.entities_by_id = {}  # entity.id -> Entity, kept in sync with self.entities
+        self.entities_by_archetype = {}  # frozenset of tags -> entities with all of them (active or not)
 
     def create_entity(self):
         """Create a new entity"""
         entity = Entity()
+        entity._manager = self
         self.entities.append(entity)
+        self.entities_by_id[entity.id] = entity
         return entity
 
     def destroy_entity(self, entity):
         """Destroy an entity"""
         entity.destroy()
 
+    def _index_tag(self, entity, tag):
+        """Record a newly added tag in entities_by_tag"""
+        bucket = self.entities_by_tag.get(tag)
+        if bucket is None:
+            self.entities_by_tag[tag] = [entity]
+        else:
+            bucket.append(entity)
+
+        # Tags are never removed, so an entity joins an archetype when it gains the last tag
+        for tags, archetype in self.entities_by_archetype.items():
+            if tag in tags and tags <= entity.tags:
+                archetype.append(entity)
+
+    def get_entity(self, entity_id):
+        """Get an entity by id (None if unknown or cleaned up)"""
+        return self.entities_by_id.get(entity_id)
+
     def get_entities_with_component(self, component_name):
         """Get all entities that have a specific component"""
         return [e for e in self.entities if e.active and e.has_component(component_name)]
 
     def get_entities_with_tag(self, tag):
         """Get all entities with a specific tag"""
-        return [e for e in self.entities if e.active and e.has_tag(tag)]
+        return [e for e in self.entities_by_tag.get(tag, ()) if e.active]
+
+    def get_tag_bucket(self, tag):
+        """Every entity with tag, active or not (callers filter). Shared list - do not modify"""
+        return self.entities_by_tag.get(tag, ())
+
+    def get_entities_with_tags(self, *tags):
+        """Get all entities with every one of tags (bucket built on first query, then kept up to date)"""
+        key = frozenset(tags)
+        archetype = self.entities_by_archetype.get(key)
+        if archetype is None:
+            rarest = min(key, key=lambda tag: len(self.entities_by_tag.get(tag, ())))
+            archetype = [e for e in self.entities_by_tag.get(rarest, ()) if key <= e.tags]
+            self.entities_by_archetype[key] = archetype
+        return [e for e in archetype if e.active]
 
     def update(self, dt):
         """Update all entity components"""
@@ -94,8 +161,15 @@ class EntityManager:
         # Don't remove enemies - they're managed by the pool
         # Only remove non-pooled entities like temporary attacks
         self.entities = [e for e in self.entities if e.active or e.has_tag("enemy")]
+        self.entities_by_id = {e.id: e for e in self.entities}
+        for tag, bucket in self.entities_by_tag.items():
+            self.entities_by_tag[tag] = [e for e in bucket if e.active or "enemy" in e.tags]
+        for tags, archetype in self.entities_by_archetype.items():
+            self.entities_by_archetype[tags] = [e for e in archetype if e.active or "enemy" in e.tags]
 
     def clear(self):
         """Clear all entities"""
         self.entities.clear()
         self.entities_by_tag.clear()
+        self.entities_by_id.clear()
+        self.entities_by_archetype.clear()
@@ -1,14 +1,23 @@
 """
 Flow-field navigation system for efficient pathfinding of large enemy groups
 """
+import heapq
 import numpy as np
-from collections import deque
+
+# Neighbor offsets (dx, dy), cardinal then diagonal; ties go to the earlier entry
+FLOW_DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0),
+                   (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+# Flow vector for each flow index: 0 = no flow, i = unit vector of FLOW_DIRECTIONS[i - 1]
+_FLOW_VECTORS = np.zeros((len(FLOW_DIRECTIONS) + 1, 2), dtype=np.float32)
+_FLOW_VECTORS[1:] = FLOW_DIRECTIONS
+_FLOW_VECTORS[1:] /= np.linalg.norm(_FLOW_VECTORS[1:], axis=1, keepdims=True)
 
 
 class FlowField:
     """
     Flow-field navigation grid.
-    Each cell stores a direction vector toward the nearest target.
+    Each cell stores a direction index (see _FLOW_VECTORS) toward the nearest target.
     """
     def __init__(self, world_width, world_height, cell_size=32):
         self.world_width = world_width
@@ -19,8 +28,8 @@ class FlowField:
         self.grid_width = world_width // cell_size
         self.grid_height = world_height // cell_size
 
-        # Flow field: direction vectors for each cell
-        self.flow = np.zeros((self.grid_height, self.grid_width, 2), dtype=np.float32)
+        # Flow field: direction index for each cell (0 = no flow)
+        self.flow = np.zeros((self.grid_height, self.grid_width), dtype=np.int8)
 
         # Cost field: navigation cost for each cell (0 = normal, higher = obstacle)
         self.cost_field = np.ones((self.grid_height, self.grid_width), dtype=np.float32)
@@ -62,75 +71,61 @@ class FlowField:
                 self.generate_flow_field()
 
     def generate_flow_field(self):
-        """Generate flow field using Dijkstra-like algorithm"""
-        # Reset integration field
-        self.integration_field.fill(np.inf)
-
-        # BFS queue
-        queue = deque()
+        """Generate flow field using Dijkstra's algorithm"""
+        # Relax on flat Python lists (NumPy scalar indexing is slow per step). The grid gets a
+        # one-cell border of inf cost so neighbors never need bounds checks: cell = y * stride + x
+        stride = self.grid_width + 2
+        cost = np.pad(self.cost_field, 1, constant_values=np.inf).ravel().tolist()
+        integration = [np.inf] * len(cost)
+        steps = [(dy * stride + dx, 1.414 if dx and dy else 1.0)  # Diagonal vs cardinal
+                 for dx, dy in FLOW_DIRECTIONS]
+
+        # Priority queue of (cost, cell); stale entries are skipped when popped
+        queue = []
 
         # Initialize targets with 0 cost
-        for target in self.targets:
-            gx, gy = target
-            self.integration_field[gy, gx] = 0
-            queue.append((gx, gy))
-
-        # Dijkstra's algorithm to calculate integration field
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0),  # Cardinal
-                     (1, 1), (1, -1), (-1, 1), (-1, -1)]  # Diagonal
+        for gx, gy in self.targets:
+            cell = (gy + 1) * stride + gx + 1
+            integration[cell] = 0.0
+            queue.append((0.0, cell))
 
+        # Each cell is expanded once, in order of its final cost
         while queue:
-            cx, cy = queue.popleft()
-            current_cost = self.integration_field[cy, cx]
+            current_cost, cell = heapq.heappop(queue)
+            if current_cost > integration[cell]:
+                continue
 
-            for dx, dy in directions:
-                nx, ny = cx + dx, cy + dy
+            for offset, move_cost in steps:
+                neighbor = cell + offset
+                new_cost = current_cost + move_cost * cost[neighbor]
 
-                # Check bounds
-                if not (0 <= nx < self.grid_width and 0 <= ny < self.grid_height):
-                    continue
+                # Update if we found a better path (never true for border cells)
+                if new_cost < integration[neighbor]:
+                    integration[neighbor] = new_cost
+                    heapq.heappush(queue, (new_cost, neighbor))
 
-                # Calculate new cost
-                move_cost = 1.414 if abs(dx) + abs(dy) == 2 else 1.0  # Diagonal vs cardinal
-                new_cost = current_cost + move_cost * self.cost_field[ny, nx]
-
-                # Update if we found a better path
-                if new_cost < self.integration_field[ny, nx]:
-                    self.integration_field[ny, nx] = new_cost
-                    queue.append((nx, ny))
+        padded = np.reshape(integration, (self.grid_height + 2, stride))
+        self.integration_field[...] = padded[1:-1, 1:-1]
 
         # Generate flow field from integration field
         self.generate_flow_vectors()
 
     def generate_flow_vectors(self):
-        """Generate flow vectors from integration field"""
-        directions = [
-            (0, 1), (1, 0), (0, -1), (-1, 0),  # Cardinal
-            (1, 1), (1, -1), (-1, 1), (-1, -1)  # Diagonal
-        ]
-
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                if np.isinf(self.integration_field[y, x]):
-                    self.flow[y, x] = [0, 0]
-                    continue
-
-                # Find direction to lowest cost neighbor
-                best_cost = self.integration_field[y, x]
-                best_dir = np.array([0.0, 0.0])
-
-                for dx, dy in directions:
-                    nx, ny = x + dx, y + dy
-                    if 0 <= nx < self.grid_width and 0 <= ny < self.grid_height:
-                        if self.integration_field[ny, nx] < best_cost:
-                            best_cost = self.integration_field[ny, nx]
-                            best_dir = np.array([dx, dy], dtype=np.float32)
-
-                # Normalize
-                if np.linalg.norm(best_dir) > 0:
-                    best_dir = best_dir / np.linalg.norm(best_dir)
-
-                self.flow[y, x] = best_dir
+        """Generate flow directions from integration field (points at the lowest-cost neighbor)"""
+        field = self.integration_field
+        height, width = field.shape
+
+        # Cost of each neighbor per cell, out-of-grid neighbors as inf: shape (8, H, W)
+        padded = np.pad(field, 1, constant_values=np.inf)
+        neighbors = np.stack([padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+                              for dx, dy in FLOW_DIRECTIONS])
+
+        best = np.argmin(neighbors, axis=0)
+        best_cost = np.take_along_axis(neighbors, best[np.newaxis], axis=0)[0]
+
+        # Unreachable cells and local minima (targets) get no flow
+        moving = np.isfinite(field) & (best_cost < field)
+        self.flow[...] = np.where(moving, best + 1, 0)
 
     def get_direction(self, x, y):
         """Get flow direction at world position"""
@@ -138,8 +133,19 @@ class FlowField:
         grid_y = int(y // self.cell_size)
 
         if 0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height:
-            return self.flow[grid_y, grid_x]
-        return np.array([0.0, 0.0])
+            return _FLOW_VECTORS[self.flow[grid_y, grid_x]]
+        return _FLOW_VECTORS[0]
+
+    def get_directions(self, xs, ys):
+        """Get flow directions at many world positions at once, as an (N, 2) array"""
+        grid_x = np.floor_divide(xs, self.cell_size).astype(np.intp)
+        grid_y = np.floor_divide(ys, self.cell_size).astype(np.intp)
+        inside = (grid_x >= 0) & (grid_x < self.grid_width) & (grid_y >= 0) & (grid_y < self.grid_height)
+
+        # Cells outside the grid read index 0 (no flow)
+        indices = np.zeros(grid_x.shape, dtype=np.int8)
+        indices[inside] = self.flow[grid_y[inside], grid_x[inside]]
+        return _FLOW_VECTORS[indices]
 
     def get_cell_center(self, grid_x, grid_y):
         """Get world position of cell center"""
@@ -149,23 +155,18 @@ class FlowField:
     def draw_debug(self, surface, camera_offset=(0, 0)):
         """Draw flow field for debugging"""
         import pygame
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                # Skip cells with no flow
-                if np.linalg.norm(self.flow[y, x]) < 0.01:
-                    continue
-
-                # Get cell center in world space
-                cx, cy = self.get_cell_center(x, y)
-
-                # Apply camera offset
-                screen_x = cx - camera_offset[0]
-                screen_y = cy - camera_offset[1]
-
-                # Draw arrow
-                direction = self.flow[y, x]
-                end_x = screen_x + direction[0] * self.cell_size * 0.3
-                end_y = screen_y + direction[1] * self.cell_size * 0.3
-
-                pygame.draw.line(surface, (100, 255, 100),
-                               (screen_x, screen_y), (end_x, end_y), 1)
+        for y, x in zip(*np.nonzero(self.flow)):  # Cells with flow
+            # Get cell center in world space
+            cx, cy = self.get_cell_center(x, y)
+
+            # Apply camera offset
+            screen_x = cx - camera_offset[0]
+            screen_y = cy - camera_offset[1]
+
+            # Draw arrow
+            direction = _FLOW_VECTORS[self.flow[y, x]]
+            end_x = screen_x + direction[0] * self.cell_size * 0.3
+            end_y = screen_y + direction[1] * self.cell_size * 0.3
+
+            pygame.draw.line(surface, (100, 255, 100),
+                           (screen_x, screen_y), (end_x, end_y), 1)
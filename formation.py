@@ -3,6 +3,12 @@ Formation system with dynamic looseness and command influence radius
 """
 import math
 import random
+import numpy as np
+from game.blackboard import Order
+
+# Squads at least this large get formation positions from the vectorized
+# Formation.get_positions; below it NumPy call overhead outweighs the per-unit loop
+VECTORIZED_FORMATION_MIN_UNITS = 32
 
 
 class FormationType:
@@ -141,6 +147,82 @@ class Formation:
 
         return (center_x + rotated_x, center_y + rotated_y)
 
+    def get_positions(self, total_units, center_x, center_y, facing_angle=0):
+        """
+        Vectorized get_position_in_formation for indices 0..total_units-1.
+        Returns an (N, 2) float array of (x, y) with looseness variance applied.
+        """
+        spacing = self.base_spacing * (1.0 + self.looseness)
+        index = np.arange(total_units, dtype=np.float64)
+
+        if self.type == FormationType.LINE:
+            # Horizontal line
+            offset_x = (index - total_units / 2) * spacing
+            offset_y = np.zeros(total_units)
+
+        elif self.type == FormationType.COLUMN:
+            # Vertical column (2-wide)
+            offset_x = (index % 2 - 0.5) * spacing * 0.5
+            offset_y = (index // 2) * spacing
+
+        elif self.type == FormationType.WEDGE:
+            # V-shaped wedge: row r holds 2r+1 units, so it starts at index r^2
+            row = np.floor(np.sqrt(index))
+            units_in_row = 2 * row + 1
+            offset_x = (index - row * row - units_in_row / 2) * spacing
+            offset_y = row * spacing * 0.866  # sqrt(3)/2 for equilateral triangle
+
+        elif self.type == FormationType.SKIRMISH:
+            # Irregular cloud formation
+            angle = np.random.uniform(0, 2 * math.pi, total_units)
+            radius = np.random.uniform(0, total_units * spacing * 0.3, total_units)
+            offset_x = np.cos(angle) * radius
+            offset_y = np.sin(angle) * radius
+
+        elif self.type == FormationType.PROTECTIVE_CIRCLE:
+            # Leader at index 0 (center); ring k holds 6(k+1) soldiers and
+            # starts after 3k(k+1) soldiers
+            soldiers_index = np.maximum(index - 1, 0)
+            ring = np.floor((np.sqrt(1 + soldiers_index * 4 / 3) - 1) / 2)
+            ring -= 3 * ring * (ring + 1) > soldiers_index          # Guard float rounding
+            ring += 3 * (ring + 1) * (ring + 2) <= soldiers_index
+            position_in_ring = soldiers_index - 3 * ring * (ring + 1)
+            angle = position_in_ring / ((ring + 1) * 6) * 2 * math.pi
+            radius = (ring + 1) * spacing * 0.8
+            radius[:1] = 0.0
+            offset_x = np.cos(angle) * radius
+            offset_y = np.sin(angle) * radius
+
+        elif self.type == FormationType.GENERAL_BOX:
+            # Rectangle formation - wider and more organized
+            units_per_row = int(math.sqrt(total_units)) + 1
+            offset_x = (index % units_per_row - units_per_row / 2) * spacing * 1.2
+            offset_y = (index // units_per_row - (total_units / units_per_row) / 2) * spacing * 1.2
+
+        elif self.type == FormationType.CAPTURE_SPREAD:
+            # Evenly spaced on a fixed 70px circle to fit within base capture zones
+            angle = index / total_units * 2 * math.pi
+            offset_x = np.cos(angle) * 70
+            offset_y = np.sin(angle) * 70
+
+        else:
+            offset_x = np.zeros(total_units)
+            offset_y = np.zeros(total_units)
+
+        # Apply looseness variance (random deviation from perfect position)
+        if self.looseness > 0:
+            variance = spacing * self.looseness * 0.5
+            offset_x = offset_x + np.random.uniform(-variance, variance, total_units)
+            offset_y = offset_y + np.random.uniform(-variance, variance, total_units)
+
+        # Rotate by facing angle
+        cos_a = math.cos(facing_angle)
+        sin_a = math.sin(facing_angle)
+        positions = np.empty((total_units, 2))
+        positions[:, 0] = center_x + offset_x * cos_a - offset_y * sin_a
+        positions[:, 1] = center_y + offset_x * sin_a + offset_y * cos_a
+        return positions
+
     def calculate_cohesion(self, unit_positions, formation_positions):
         """
         Calculate how well units match their formation positions.
@@ -174,31 +256,31 @@ class Formation:
         Returns new Formation instance.
 
         Args:
-            order_type: Type of order (defend, attack, capture, etc.)
+            order_type: Order member (Order.DEFEND, Order.ATTACK, Order.CAPTURE, etc.)
             is_general: True if this is a general's formation
         """
-        if order_type == "capture":
+        if order_type == Order.CAPTURE:
             # Capturing base - spread out
             return Formation(FormationType.CAPTURE_SPREAD, looseness=0.5)
-        elif order_type == "defend":
+        elif order_type == Order.DEFEND:
             # Defending - protective circle or box
             if is_general:
                 return Formation(FormationType.GENERAL_BOX, looseness=0.2)
             else:
                 return Formation(FormationType.PROTECTIVE_CIRCLE, looseness=0.2)
-        elif order_type == "move" or order_type == "regroup" or order_type == "advance" or order_type == "expand":
+        elif order_type in (Order.MOVE, Order.REGROUP, Order.ADVANCE, Order.EXPAND):
             # Moving - general uses box, officers use protective circle
             if is_general:
                 return Formation(FormationType.GENERAL_BOX, looseness=0.3)
             else:
                 return Formation(FormationType.PROTECTIVE_CIRCLE, looseness=0.3)
-        elif order_type == "attack":
+        elif order_type == Order.ATTACK:
             # Attacking - tighter formations
             if is_general:
                 return Formation(FormationType.GENERAL_BOX, looseness=0.2)
             else:
                 return Formation(FormationType.PROTECTIVE_CIRCLE, looseness=0.2)
-        elif order_type == "skirmish":
+        elif order_type == Order.SKIRMISH:
             return Formation(FormationType.SKIRMISH, looseness=0.8)
         else:
             # Default - protective formations
@@ -253,7 +335,7 @@ class CommandInfluence:
             max_radius = CommandInfluence.INFLUENCE_RADIUS.get(looking_for, 300)
 
         nearest = None
-        nearest_dist = float('inf')
+        nearest_dist_sq = max_radius * max_radius
 
         for commander, rank, cmd_x, cmd_y in commanders:
             if rank != looking_for:
@@ -261,13 +343,15 @@ class CommandInfluence:
 
             dx = cmd_x - unit_x
             dy = cmd_y - unit_y
-            dist = math.sqrt(dx*dx + dy*dy)
+            dist_sq = dx*dx + dy*dy
 
-            if dist <= max_radius and dist < nearest_dist:
+            if dist_sq <= nearest_dist_sq and (nearest is None or dist_sq < nearest_dist_sq):
                 nearest = commander
-                nearest_dist = dist
+                nearest_dist_sq = dist_sq
 
-        return (nearest, nearest_dist)
+        if nearest is None:
+            return (None, float('inf'))
+        return (nearest, math.sqrt(nearest_dist_sq))
 
     @staticmethod
     def get_units_in_command_radius(commander_x, commander_y, commander_rank, potential_subordinates):
@@ -320,11 +404,23 @@ class FormationManager:
         """Set the center point and facing for formation"""
         self.formation_centers[squad_id] = (x, y, facing_angle)
 
+    def get_formation_positions_np(self, squad_id, unit_count):
+        """Get ideal positions for all units in formation as an (N, 2) array"""
+        if squad_id not in self.formations:
+            return np.zeros((0, 2))
+
+        formation = self.formations[squad_id]
+        center = self.formation_centers.get(squad_id, (0, 0, 0))
+        return formation.get_positions(unit_count, center[0], center[1], center[2])
+
     def get_formation_positions(self, squad_id, unit_count):
         """Get ideal positions for all units in formation"""
         if squad_id not in self.formations:
             return []
 
+        if unit_count >= VECTORIZED_FORMATION_MIN_UNITS:
+            return [tuple(pos) for pos in self.get_formation_positions_np(squad_id, unit_count).tolist()]
+
         formation = self.formations[squad_id]
         center = self.formation_centers.get(squad_id, (0, 0, 0))
 
@@ -356,6 +452,52 @@ class FormationManager:
 
         return cohesion
 
+    def update_cohesion_batch(self, squad_positions):
+        """
+        update_cohesion for many squads in one vectorized pass.
+        squad_positions: {squad_id: [(x, y), ...]} (non-empty lists).
+        Returns {squad_id: cohesion}.
+        """
+        results = {}
+        formations = []
+        unit_positions = []
+        slot_positions = []
+        counts = []
+        limits = []
+
+        for squad_id, positions in squad_positions.items():
+            formation = self.formations.get(squad_id)
+            if formation is None:
+                results[squad_id] = 1.0
+                continue
+
+            formations.append((squad_id, formation))
+            unit_positions.extend(positions)
+            slot_positions.extend(self.get_formation_positions(squad_id, len(positions)))
+            counts.append(len(positions))
+            limits.append(formation.base_spacing * (1 + formation.looseness))
+
+        if not formations:
+            return results
+
+        # Per-unit deviation from its slot, normalized by the squad's max acceptable deviation
+        units = np.array(unit_positions, dtype=np.float64)
+        slots = np.array(slot_positions, dtype=np.float64)
+        counts = np.array(counts)
+        deviation = np.hypot(units[:, 0] - slots[:, 0], units[:, 1] - slots[:, 1])
+        normalized = np.minimum(1.0, deviation / np.repeat(limits, counts))
+
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        cohesions = 1.0 - np.add.reduceat(normalized, starts) / counts
+
+        for (squad_id, formation), cohesion in zip(formations, cohesions.tolist()):
+            formation.is_broken = cohesion < formation.break_threshold
+            if formation.is_broken and squad_id not in self.regroup_orders:
+                self.issue_regroup(squad_id)
+            results[squad_id] = cohesion
+
+        return results
+
     def issue_regroup(self, squad_id, duration=3.0):
         """
         Issue regroup order - squad halts other activities to reform.
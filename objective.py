@@ -2,7 +2,8 @@
 Capturable bases and objective system
 """
 import json
-import math
+import numpy as np
+from core.spatial import SpatialHash
 
 
 class Base:
@@ -12,6 +13,12 @@ class Base:
         self.x = x
         self.y = y
         self.radius = radius
+        self.base_id = -1  # Index in ObjectiveSystem.bases, assigned on registration
+
+        # Static squared radii for officer proximity checks
+        self.radius_sq = radius * radius
+        self.hold_radius_sq = (radius * 0.3) ** 2  # Defensive capture: close enough to hold
+        self.approach_radius_sq = 0.0  # (radius + approach_margin)^2, set by ObjectiveSystem
 
         # Ownership (-1 = neutral, 0 = team 0/blue, 1 = team 1/red)
         self.owner = -1
@@ -62,8 +69,7 @@ class Base:
         """Check if a unit is in capture range"""
         dx = x - self.x
         dy = y - self.y
-        distance = math.sqrt(dx*dx + dy*dy)
-        return distance <= self.radius
+        return dx*dx + dy*dy <= self.radius_sq
 
 
 class ObjectiveSystem:
@@ -75,6 +81,50 @@ class ObjectiveSystem:
         self.player_score = 0
         self.enemy_score = 0
 
+        # Structure-of-arrays view of bases for vectorized AI queries
+        # (row i always describes self.bases[i])
+        self.bases_xy = np.zeros((0, 2), dtype=np.float32)
+        self.bases_owner = np.zeros(0, dtype=np.int8)
+
+        # Bases bucketed by owner (-1 = neutral, 0 = team 0, 1 = team 1), in base-list order
+        self._bases_by_owner = {-1: [], 0: [], 1: []}
+
+        # Static grid of base approach areas (radius + approach_margin), for officer proximity checks
+        self.approach_margin = 150
+        self._approach_grid = SpatialHash(cell_size=200)
+        self._approach_bounds = (0.0, 0.0, -1.0, -1.0)  # (min_x, min_y, max_x, max_y) covering all approach areas
+
+    def _rebuild_base_arrays(self):
+        """Rebuild SoA base arrays and owner buckets after the base list changes"""
+        self.bases_xy = np.array([(b.x, b.y) for b in self.bases], dtype=np.float32).reshape(-1, 2)
+        self.bases_owner = np.array([b.owner for b in self.bases], dtype=np.int8)
+        for owner in self._bases_by_owner:
+            self._rebuild_owner_bucket(owner)
+
+        self._approach_grid.clear()
+        min_x = min_y = float('inf')
+        max_x = max_y = float('-inf')
+        for base in self.bases:
+            approach_radius = base.radius + self.approach_margin
+            base.approach_radius_sq = approach_radius * approach_radius
+            self._approach_grid.insert(base, base.x, base.y, approach_radius)
+
+            min_x = min(min_x, base.x - approach_radius)
+            min_y = min(min_y, base.y - approach_radius)
+            max_x = max(max_x, base.x + approach_radius)
+            max_y = max(max_y, base.y + approach_radius)
+        self._approach_bounds = (min_x, min_y, max_x, max_y)
+
+    def _rebuild_owner_bucket(self, owner):
+        """Refill one owner bucket, keeping base-list order"""
+        self._bases_by_owner[owner] = [b for b in self.bases if b.owner == owner]
+
+    def _on_owner_change(self, index, base, old_owner):
+        """Move a base between owner buckets after it changes hands"""
+        self.bases_owner[index] = base.owner
+        self._rebuild_owner_bucket(old_owner)
+        self._rebuild_owner_bucket(base.owner)
+
     def load_config(self, config_path):
         """Load objectives from JSON"""
         try:
@@ -89,7 +139,9 @@ class ObjectiveSystem:
                         base_data['y'],
                         base_data.get('radius', 100)
                     )
+                    base.base_id = len(self.bases)
                     self.bases.append(base)
+                self._rebuild_base_arrays()
                 return True
         except Exception as e:
             print(f"Failed to load objective config: {e}")
@@ -98,9 +150,31 @@ class ObjectiveSystem:
     def add_base(self, name, x, y, radius=100):
         """Manually add a base"""
         base = Base(name, x, y, radius)
+        base.base_id = len(self.bases)
         self.bases.append(base)
+        self._rebuild_base_arrays()
         return base
 
+    def find_base_at(self, x, y, tolerance=50):
+        """Get the first base whose center is within tolerance of (x, y), or None"""
+        if not self.bases:
+            return None
+        offsets = self.bases_xy - (x, y)
+        dist_sq = np.sum(offsets * offsets, axis=1)
+        matches = np.flatnonzero(dist_sq < tolerance * tolerance)
+        return self.bases[matches[0]] if matches.size else None
+
+    def get_bases_near(self, x, y):
+        """
+        Candidate bases whose approach area (radius + approach_margin) may contain (x, y).
+        Broad phase only - callers still check the exact distance. Shared list - do not modify
+        """
+        # Trivial reject: outside the box around every approach area
+        min_x, min_y, max_x, max_y = self._approach_bounds
+        if not (min_x <= x <= max_x and min_y <= y <= max_y):
+            return ()
+        return self._approach_grid.query_point(x, y)
+
     def update(self, dt):
         """Update all bases"""
         try:
@@ -110,7 +184,7 @@ class ObjectiveSystem:
             # Also include player
             player_entities = self.entity_manager.get_entities_with_tag("player")
 
-            for base in self.bases:
+            for i, base in enumerate(self.bases):
                 # Calculate capture power (not just count) for each team
                 team0_power = 0.0  # Blue/Player team
                 team1_power = 0.0  # Red/Enemy team
@@ -128,12 +202,12 @@ class ObjectiveSystem:
                         continue
 
                     # Skip dead units
-                    health = unit_entity.get_component("Health")
+                    health = unit_entity.health
                     if health and health.dead:
                         continue
 
-                    transform = unit_entity.get_component("Transform")
-                    unit = unit_entity.get_component("Unit")
+                    transform = unit_entity.transform
+                    unit = unit_entity.unit
 
                     if transform and unit and base.is_unit_in_range(transform.x, transform.y):
                         # Get rank-based capture rate
@@ -156,9 +230,11 @@ class ObjectiveSystem:
                             team0_power += 0.1
 
                 # Update base with capture power (not count)
+                old_owner = base.owner
                 ownership_changed = base.update(dt, team0_power, team1_power)
 
                 if ownership_changed:
+                    self._on_owner_change(i, base, old_owner)
                     self.on_base_captured(base)
 
             # Update flow field targets based on player-owned bases
@@ -194,14 +270,22 @@ class ObjectiveSystem:
                 if player_transform:
                     self.flowfield.add_target(player_transform.x, player_transform.y)
 
+    def get_team_bases(self, team_id):
+        """Get list of bases owned by team_id (-1 = neutral). Shared list - do not modify"""
+        return self._bases_by_owner[team_id]
+
+    def get_enemy_bases_for(self, team_id):
+        """Get list of bases owned by team_id's opponent. Shared list - do not modify"""
+        return self._bases_by_owner[1 - team_id]
+
     def get_player_bases(self):
         """Get list of player-owned bases (team 0)"""
-        return [b for b in self.bases if b.owner == 0]
+        return self._bases_by_owner[0]
 
     def get_enemy_bases(self):
         """Get list of enemy-owned bases (team 1)"""
-        return [b for b in self.bases if b.owner == 1]
+        return self._bases_by_owner[1]
 
     def get_neutral_bases(self):
         """Get list of neutral bases"""
-        return [b for b in self.bases if b.owner == -1]
+        return self._bases_by_owner[-1]
@@ -50,6 +50,18 @@ class SpatialHash:
             if entity not in self.grid[cell]:
                 self.grid[cell].append(entity)
 
+    def insert_unchecked(self, entity, x, y):
+        """
+        Insert a point entity without the duplicate check.
+        Only for filling a freshly cleared hash, where each entity is inserted once
+        """
+        cell = self._get_cell_key(x, y)
+        bucket = self.grid.get(cell)
+        if bucket is None:
+            self.grid[cell] = [entity]
+        else:
+            bucket.append(entity)
+
     def remove(self, entity, x, y, radius=0):
         """Remove entity from spatial hash"""
         if radius > 0:
@@ -77,7 +89,7 @@ class SpatialHash:
         radius_sq = radius * radius
 
         for entity in entities:
-            transform = entity.get_component("Transform")
+            transform = entity.transform
             if transform:
                 dx = transform.x - x
                 dy = transform.y - y
@@ -87,6 +99,13 @@ class SpatialHash:
 
         return results
 
+    def query_point(self, x, y):
+        """
+        Broad phase only: entities whose inserted bounds cover the cell containing (x, y).
+        Shared list - do not modify
+        """
+        return self.grid.get(self._get_cell_key(x, y), ())
+
     def query_rect(self, x, y, width, height):
         """Query all entities within a rectangle"""
         min_x, max_x = x, x + width
@@ -116,13 +135,13 @@ class SpatialHash:
         for entity in entities:
             if entity.active:
                 # Skip dead entities from spatial hash
-                health = entity.get_component("Health")
+                health = entity.health
                 if health and health.dead:
                     continue
 
-                transform = entity.get_component("Transform")
+                transform = entity.transform
                 if transform:
-                    sprite = entity.get_component("Sprite")
+                    sprite = entity.sprite
                     radius = max(sprite.width, sprite.height) // 2 if sprite else 0
                     self.insert(entity, transform.x, transform.y, radius)
 
@@ -144,8 +163,8 @@ class CollisionSystem:
         hits = []
 
         for entity in entities:
-            combat = entity.get_component("Combat")
-            health = entity.get_component("Health")
+            combat = entity.combat
+            health = entity.health
 
             # Check if entity can be hit (but don't apply damage here!)
             if combat and health and combat.team != attacker_team:
@@ -156,7 +175,7 @@ class CollisionSystem:
 
     def check_entity_collisions(self, entity, radius):
         """Check for collisions with other entities"""
-        transform = entity.get_component("Transform")
+        transform = entity.transform
         if not transform:
             return []
 
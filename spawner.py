@@ -129,8 +129,7 @@ class Spawner:
         """Count active AND alive enemies of a specific type"""
         count = 0
         tag = enemy_type  # "grunt" or "officer"
-        enemies = self.entity_manager.get_entities_with_tag(tag)
-        for enemy in enemies:
+        for enemy in self.entity_manager.get_tag_bucket(tag):
             if enemy.active:
                 # Also check if enemy is actually alive (not dead)
                 health = enemy.get_component("Health")
@@ -24,12 +24,12 @@ class RenderSystem(System):
                 continue
 
             # Skip dead entities to prevent rendering corpses
-            health = entity.get_component("Health")
+            health = entity.health
             if health and health.dead:
                 continue
 
-            sprite_comp = entity.get_component("Sprite")
-            transform = entity.get_component("Transform")
+            sprite_comp = entity.sprite
+            transform = entity.transform
 
             if sprite_comp and transform and sprite_comp.visible:
                 sprites.append((entity, sprite_comp, transform))
@@ -104,8 +104,8 @@ class CombatSystem(System):
 
             # Apply damage and handle hits
             for entity in hits:
-                transform = entity.get_component("Transform")
-                health = entity.get_component("Health")
+                transform = entity.transform
+                health = entity.health
 
                 if transform and health:
                     # Apply damage (CollisionSystem no longer does this)
@@ -139,10 +139,9 @@ class CombatSystem(System):
         self.pending_attacks.clear()
 
         # Handle ALL dead enemies (including those killed by AttackSystem)
-        enemies = self.entity_manager.get_entities_with_tag("enemy")
-        for enemy in enemies:
+        for enemy in self.entity_manager.get_tag_bucket("enemy"):
             if enemy.active:  # Only process active enemies
-                health = enemy.get_component("Health")
+                health = enemy.health
                 if health and health.dead:
                     # Return to pool
                     if self.pool_manager:
@@ -156,13 +155,12 @@ class CombatSystem(System):
                         enemy.destroy()
 
         # Handle dead army units (soldiers, officers, generals)
-        army_units = self.entity_manager.get_entities_with_tag("unit")
-        for unit in army_units:
+        for unit in self.entity_manager.get_tag_bucket("unit"):
             if unit.active:
-                health = unit.get_component("Health")
+                health = unit.health
                 if health and health.dead:
                     # Remove from squad assignments
-                    unit_comp = unit.get_component("Unit")
+                    unit_comp = unit.unit
                     if unit_comp and unit_comp.squad_id:
                         # Notify blackboard (handled in army_systems)
                         pass
@@ -171,7 +169,6 @@ class CombatSystem(System):
 
         # Check for contact damage (enemies touching player)
         players = self.entity_manager.get_entities_with_tag("player")
-        enemies = self.entity_manager.get_entities_with_tag("enemy")
 
         for player in players:
             if not player.active:
@@ -188,7 +185,7 @@ class CombatSystem(System):
 
             for entity in nearby:
                 if entity.has_tag("enemy") and entity.active:
-                    enemy_combat = entity.get_component("Combat")
+                    enemy_combat = entity.combat
                     if enemy_combat and enemy_combat.can_attack():
                         player_health.take_damage(enemy_combat.damage)
                         enemy_combat.attack()
@@ -199,18 +196,18 @@ class CombatSystem(System):
     def _handle_army_combat(self, dt):
         """Handle combat between army units"""
         # Get all army units
-        army_units = self.entity_manager.get_entities_with_tag("unit")
+        army_units = self.entity_manager.get_tag_bucket("unit")
 
         for attacker in army_units:
             if not attacker.active:
                 continue
 
-            attacker_health = attacker.get_component("Health")
+            attacker_health = attacker.health
             if attacker_health and attacker_health.dead:
                 continue
 
-            attacker_transform = attacker.get_component("Transform")
-            attacker_combat = attacker.get_component("Combat")
+            attacker_transform = attacker.transform
+            attacker_combat = attacker.combat
 
             if not attacker_transform or not attacker_combat:
                 continue
@@ -230,17 +227,17 @@ class CombatSystem(System):
                 if not defender.has_tag("unit"):
                     continue
 
-                defender_combat = defender.get_component("Combat")
+                defender_combat = defender.combat
                 if not defender_combat or defender_combat.team == attacker_combat.team:
                     continue
 
-                defender_health = defender.get_component("Health")
+                defender_health = defender.health
                 if not defender_health or defender_health.dead:
                     continue
 
                 # Apply morale modifier if unit has one
                 damage = attacker_combat.damage
-                unit_comp = attacker.get_component("Unit")
+                unit_comp = attacker.unit
                 if unit_comp:
                     damage *= unit_comp.get_combat_modifier()
 
@@ -249,7 +246,7 @@ class CombatSystem(System):
                 attacker_combat.attack()
 
                 # Visual feedback
-                defender_transform = defender.get_component("Transform")
+                defender_transform = defender.transform
                 if defender_transform:
                     if self.particle_system:
                         color = (255, 100, 100) if defender_combat.team == 0 else (255, 180, 80)